@@ -96,6 +96,8 @@ class Agent:
         self._middleware = MiddlewareChain()
         self._has_streaming = False
         self._mcp_servers: List[str] = []
+        # Built lazily by get_app(); reset whenever the agent card or executor would change
+        self._app = None
 
         # Setup optional network
         if self.network is not None:
@@ -200,7 +202,7 @@ class Agent:
                 auth_param = auth_param or "auth"
 
             # Extract schemas
-            input_schema, output_schema = extract_function_schemas(func)
+            input_schema, output_schema = extract_function_schemas(func, resolved_hints)
 
             skill_def = SkillDefinition(
                 name=skill_name,
@@ -217,9 +219,11 @@ class Agent:
                 task_context_param=task_context_param,
                 auth_param=auth_param,
                 mcp_param=mcp_param,
+                type_hints=resolved_hints,
             )
 
             self._skills[skill_name] = skill_def
+            self._app = None
             return func
 
         return decorator
@@ -235,15 +239,18 @@ class Agent:
                 return await next()
         """
         self._middleware.add(func)
+        self._app = None
         return func
 
     def add_middleware(self, middleware: Callable) -> None:
         """Add a middleware function (non-decorator version)."""
         self._middleware.add(middleware)
+        self._app = None
 
     def on_error(self, func: Callable) -> Callable:
         """Decorator to register a global error handler."""
         self._error_handler = func
+        self._app = None
         return func
 
     def on_startup(self, func: Callable) -> Callable:
@@ -259,6 +266,7 @@ class Agent:
     def on_complete(self, func: Callable) -> Callable:
         """Decorator to register a task completion handler."""
         self._on_complete.append(func)
+        self._app = None
         return func
 
     def add_mcp_server(self, url: str) -> None:
@@ -281,6 +289,7 @@ class Agent:
                 return result
         """
         self._mcp_servers.append(url)
+        self._app = None
 
     async def delegate(
         self,
@@ -529,7 +538,16 @@ class Agent:
             return response.model_dump()
 
     def get_app(self):
-        """Get the Starlette application without running it."""
+        """
+        Get the Starlette application without running it.
+
+        The app is built once and reused by later calls. Registering a skill,
+        middleware, error handler, completion hook or MCP server rebuilds it
+        on the next call.
+        """
+        if self._app is not None:
+            return self._app
+
         agent_card = self.build_agent_card()
         executor = LiteAgentExecutor(
             skills=self._skills,
@@ -565,4 +583,5 @@ class Agent:
                 allow_headers=["*"],
             )
 
+        self._app = app
         return app
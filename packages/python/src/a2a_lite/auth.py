@@ -50,7 +50,7 @@ class AuthProvider(ABC):
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthRequest:
     """Incoming authentication request."""
 
@@ -72,7 +72,7 @@ class AuthRequest:
         return None
 
 
-@dataclass
+@dataclass(slots=True)
 class AuthResult:
     """Authentication result."""
 
@@ -128,8 +128,10 @@ class APIKeyAuth(AuthProvider):
         header: str = "X-API-Key",
         query_param: Optional[str] = None,
     ):
-        # Store only hashes of keys for security
-        self._key_hashes = {hashlib.sha256(k.encode()).hexdigest() for k in keys}
+        # Store only hashes of keys for security; fixed after construction
+        self._key_hashes = frozenset(
+            hashlib.sha256(k.encode()).hexdigest() for k in keys
+        )
         self.header = header
         self.query_param = query_param
 
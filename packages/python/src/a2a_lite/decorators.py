@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class SkillDefinition:
     """Metadata for a registered skill."""
 
@@ -24,6 +24,10 @@ class SkillDefinition:
     task_context_param: Optional[str] = None
     auth_param: Optional[str] = None
     mcp_param: Optional[str] = None
+    # Resolved handler type hints, cached so requests don't re-run get_type_hints
+    type_hints: dict[str, Any] | None = None
+    # Per-parameter conversion (kind, target type), built on first call
+    conversion_plan: dict[str, tuple[int, Any]] | None = None
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -18,11 +18,18 @@ from typing import Any, Dict, List, Optional
 class A2ALiteError(Exception):
     """Base error for all A2A Lite errors."""
 
+    # Value of the response "type" field, set per class in __init_subclass__.
+    _response_type: str = "A2ALiteError"
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._response_type = cls.__name__
+
     def to_response(self) -> Dict[str, Any]:
         """Convert error to a structured response dict."""
         return {
             "error": str(self),
-            "type": type(self).__name__,
+            "type": self._response_type,
         }
 
 
@@ -54,7 +61,7 @@ class SkillNotFoundError(A2ALiteError):
     def to_response(self) -> Dict[str, Any]:
         return {
             "error": f"Unknown skill '{self.skill}'",
-            "type": "SkillNotFoundError",
+            "type": self._response_type,
             "available_skills": list(self.available_skills.keys()),
             "details": {name: desc for name, desc in self.available_skills.items()},
         }
@@ -88,7 +95,7 @@ class ParamValidationError(A2ALiteError):
     def to_response(self) -> Dict[str, Any]:
         return {
             "error": f"Skill '{self.skill}' parameter validation failed",
-            "type": "ParamValidationError",
+            "type": self._response_type,
             "skill": self.skill,
             "validation_errors": self.errors,
         }
@@ -120,7 +127,7 @@ class AuthRequiredError(A2ALiteError):
     def to_response(self) -> Dict[str, Any]:
         resp: Dict[str, Any] = {
             "error": "Authentication required",
-            "type": "AuthRequiredError",
+            "type": self._response_type,
             "scheme": self.scheme_info,
         }
         if self.detail:
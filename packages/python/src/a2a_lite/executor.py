@@ -5,9 +5,10 @@ Wrapper around A2A's AgentExecutor that dispatches to registered skill handlers.
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, get_args, get_origin
 
 logger = logging.getLogger(__name__)
 
@@ -23,7 +24,16 @@ from .errors import (
 )
 from .middleware import MiddlewareChain, MiddlewareContext
 from .streaming import is_generator_function, stream_generator
-from .utils import _is_or_subclass
+from .utils import _is_or_subclass, _json_dumps, _json_loads
+
+# How _convert_params treats a parameter; see _build_conversion_plan
+_PASSTHROUGH = 0
+_SKIP = 1
+_FILE_PART = 2
+_DATA_PART = 3
+_MODEL = 4
+_MODEL_LIST = 5
+_PASSTHROUGH_ENTRY = (_PASSTHROUGH, None)
 
 
 class LiteAgentExecutor(AgentExecutor):
@@ -124,22 +134,13 @@ class LiteAgentExecutor(AgentExecutor):
             ctx.metadata["event_queue"] = event_queue
             ctx.metadata["auth_result"] = auth_result
 
-            # Define final handler
-            async def final_handler(ctx: MiddlewareContext) -> Any:
-                return await self._execute_skill(
-                    ctx.skill,
-                    ctx.params,
-                    event_queue,
-                    ctx.metadata,
-                )
-
             # Execute through middleware chain
-            result = await self.middleware.execute(ctx, final_handler)
+            result = await self.middleware.execute(ctx, self._final_handler)
 
             # If result is not None and not already streamed, send it
             if result is not None:
                 if isinstance(result, (dict, list)):
-                    response_text = json.dumps(result, indent=2, default=str)
+                    response_text = _json_dumps(result, indent=True)
                 else:
                     response_text = str(result)
                 await event_queue.enqueue_event(new_agent_text_message(response_text))
@@ -161,6 +162,16 @@ class LiteAgentExecutor(AgentExecutor):
         except Exception as e:
             await self._handle_error(e, event_queue)
 
+    async def _final_handler(self, ctx: MiddlewareContext) -> Any:
+        """Innermost step of the middleware chain: run the requested skill."""
+        metadata = ctx.metadata
+        return await self._execute_skill(
+            ctx.skill,
+            ctx.params,
+            metadata["event_queue"],
+            metadata,
+        )
+
     async def _execute_skill(
         self,
         skill_name: Optional[str],
@@ -169,29 +180,20 @@ class LiteAgentExecutor(AgentExecutor):
         metadata: Dict[str, Any],
     ) -> Any:
         """Execute a skill with the given parameters."""
-        available = {name: sd.description for name, sd in self.skills.items()}
+        skills = self.skills
 
         if skill_name is None:
-            if not self.skills:
+            if not skills:
                 return {"error": "No skills registered"}
             # Only auto-select if there's exactly one skill
-            if len(self.skills) == 1:
-                skill_name = list(self.skills.keys())[0]
+            if len(skills) == 1:
+                skill_name = next(iter(skills))
             else:
-                err = SkillNotFoundError(
-                    skill="(none)",
-                    available_skills=available,
-                )
-                return err.to_response()
+                return self._skill_not_found("(none)")
 
-        if skill_name not in self.skills:
-            err = SkillNotFoundError(
-                skill=skill_name,
-                available_skills=available,
-            )
-            return err.to_response()
-
-        skill_def = self.skills[skill_name]
+        skill_def = skills.get(skill_name)
+        if skill_def is None:
+            return self._skill_not_found(skill_name)
 
         # Convert Pydantic models and file parts in params — catch validation errors
         try:
@@ -240,13 +242,25 @@ class LiteAgentExecutor(AgentExecutor):
         # Call the handler
         handler = skill_def.handler
 
-        if skill_def.is_streaming or is_generator_function(handler):
-            gen = handler(**params)
-            await stream_generator(gen, event_queue)
+        # Flags are resolved at registration, so the common async case skips
+        # both generator and coroutine introspection
+        if skill_def.is_streaming:
+            await stream_generator(handler(**params), event_queue)
+            return None
+        elif skill_def.is_async:
+            return await handler(**params)
+        elif is_generator_function(handler):
+            await stream_generator(handler(**params), event_queue)
             return None
         else:
             return await self._call_handler(handler, **params)
 
+    def _skill_not_found(self, skill_name: str) -> dict[str, Any]:
+        """Build the SkillNotFoundError response listing available skills."""
+        available = {name: sd.description for name, sd in self.skills.items()}
+        err = SkillNotFoundError(skill=skill_name, available_skills=available)
+        return err.to_response()
+
     def _convert_params(
         self,
         skill_def: SkillDefinition,
@@ -254,96 +268,117 @@ class LiteAgentExecutor(AgentExecutor):
         metadata: Dict[str, Any],
     ) -> Dict[str, Any]:
         """Convert parameters to Pydantic models and file parts if needed."""
-        import typing
-
-        handler = skill_def.handler
-        try:
-            hints = typing.get_type_hints(handler)
-        except Exception as e:
-            logger.debug("Failed to get type hints for handler '%s': %s", getattr(handler, '__name__', 'unknown'), e)
-            hints = getattr(handler, "__annotations__", {})
+        plan = skill_def.conversion_plan
+        if plan is None:
+            plan = self._build_conversion_plan(skill_def)
 
         from .parts import FilePart, DataPart
 
         converted = {}
         for param_name, value in params.items():
-            if param_name == "return":
-                continue
-            param_type = hints.get(param_name)
+            kind, param_type = plan.get(param_name, _PASSTHROUGH_ENTRY)
 
-            if param_type is None:
+            if kind == _PASSTHROUGH:
                 converted[param_name] = value
+            elif kind == _SKIP:
                 continue
+            elif kind == _MODEL_LIST:
+                # One TypeAdapter call validates the whole list in pydantic-core
+                converted[param_name] = (
+                    param_type.validate_python(value) if isinstance(value, list) else value
+                )
+            elif not isinstance(value, dict):
+                converted[param_name] = value
+            elif kind == _FILE_PART:
+                # Handle both A2A format and simple dict format
+                if "file" in value:
+                    converted[param_name] = FilePart.from_a2a(value)
+                else:
+                    # Simple format: {name, data, mime_type}
+                    data = value.get("data")
+                    if isinstance(data, str):
+                        data = data.encode("utf-8")
+                    converted[param_name] = FilePart(
+                        name=value.get("name", "unknown"),
+                        mime_type=value.get("mime_type", "application/octet-stream"),
+                        data=data,
+                        uri=value.get("uri"),
+                    )
+            elif kind == _DATA_PART:
+                # Handle both A2A format and simple dict format
+                if value.get("type") == "data":
+                    converted[param_name] = DataPart.from_a2a(value)
+                else:
+                    # Simple format: pass the dict directly as data
+                    converted[param_name] = DataPart(data=value)
+            else:
+                converted[param_name] = param_type.model_validate(value)
 
-            # Skip special context types
-            from .tasks import TaskContext as _TaskContext
-            from .auth import AuthResult as _AuthResult
-            from .mcp import MCPClient as _MCPClient
+        return converted
 
+    def _build_conversion_plan(
+        self, skill_def: SkillDefinition
+    ) -> dict[str, tuple[int, Any]]:
+        """Resolve how each annotated parameter is converted, once per skill."""
+        import typing
+
+        hints = skill_def.type_hints
+        if hints is None:
+            handler = skill_def.handler
+            try:
+                hints = typing.get_type_hints(handler)
+            except Exception as e:
+                logger.debug("Failed to get type hints for handler '%s': %s", getattr(handler, '__name__', 'unknown'), e)
+                hints = getattr(handler, "__annotations__", {})
+            skill_def.type_hints = hints
+
+        from .auth import AuthResult as _AuthResult
+        from .mcp import MCPClient as _MCPClient
+        from .parts import DataPart, FilePart
+        from .tasks import TaskContext as _TaskContext
+
+        plan: dict[str, tuple[int, Any]] = {"return": (_SKIP, None)}
+        for param_name, param_type in hints.items():
+            if param_name == "return" or param_type is None:
+                continue
+
+            # Special context types are injected later, never taken from params
             if (
                 _is_or_subclass(param_type, _TaskContext)
                 or _is_or_subclass(param_type, _AuthResult)
                 or _is_or_subclass(param_type, _MCPClient)
             ):
-                continue
-
-            # Convert FilePart
-            if _is_or_subclass(param_type, FilePart):
-                if isinstance(value, dict):
-                    # Handle both A2A format and simple dict format
-                    if "file" in value:
-                        converted[param_name] = FilePart.from_a2a(value)
-                    else:
-                        # Simple format: {name, data, mime_type}
-                        data = value.get("data")
-                        if isinstance(data, str):
-                            data = data.encode("utf-8")
-                        converted[param_name] = FilePart(
-                            name=value.get("name", "unknown"),
-                            mime_type=value.get(
-                                "mime_type", "application/octet-stream"
-                            ),
-                            data=data,
-                            uri=value.get("uri"),
-                        )
-                else:
-                    converted[param_name] = value
-                continue
-
-            # Convert DataPart
-            if _is_or_subclass(param_type, DataPart):
-                if isinstance(value, dict):
-                    # Handle both A2A format and simple dict format
-                    if "type" in value and value.get("type") == "data":
-                        converted[param_name] = DataPart.from_a2a(value)
-                    else:
-                        # Simple format: pass the dict directly as data
-                        converted[param_name] = DataPart(data=value)
-                else:
-                    converted[param_name] = value
-                continue
-
-            # Convert Pydantic models
-            if hasattr(param_type, "model_validate"):
-                if isinstance(value, dict):
-                    converted[param_name] = param_type.model_validate(value)
-                else:
-                    converted[param_name] = value
-                continue
-
-            # Default: keep as-is
-            converted[param_name] = value
-
-        return converted
+                plan[param_name] = (_SKIP, None)
+            elif _is_or_subclass(param_type, FilePart):
+                plan[param_name] = (_FILE_PART, FilePart)
+            elif _is_or_subclass(param_type, DataPart):
+                plan[param_name] = (_DATA_PART, DataPart)
+            elif hasattr(param_type, "model_validate"):
+                plan[param_name] = (_MODEL, param_type)
+            elif get_origin(param_type) is list:
+                args = get_args(param_type)
+                if len(args) == 1 and hasattr(args[0], "model_validate"):
+                    from pydantic import TypeAdapter
+
+                    plan[param_name] = (_MODEL_LIST, TypeAdapter(param_type))
+
+        skill_def.conversion_plan = plan
+        return plan
 
     def _parse_message(self, message: str) -> tuple[Optional[str], Dict[str, Any]]:
         """Parse message to extract skill name and params."""
-        try:
-            data = json.loads(message)
-            if isinstance(data, dict) and "skill" in data:
-                return data["skill"], data.get("params", {})
-        except json.JSONDecodeError:
-            logger.debug("Message is not JSON, treating as plain text")
+        # Only a JSON object with a "skill" key can be a skill call; anything
+        # else is plain text and skips the parse (and its exception) entirely
+        if (
+            message[:1] == "{" or message.lstrip()[:1] == "{"
+        ) and '"skill"' in message:
+            try:
+                data = _json_loads(message)
+            except json.JSONDecodeError:
+                logger.debug("Message is not JSON, treating as plain text")
+            else:
+                if isinstance(data, dict) and "skill" in data:
+                    return data["skill"], data.get("params", {})
 
         return None, {"message": message}
 
@@ -385,7 +420,7 @@ class LiteAgentExecutor(AgentExecutor):
             try:
                 result = await self._call_handler(self.error_handler, e)
                 await event_queue.enqueue_event(
-                    new_agent_text_message(json.dumps(result, default=str))
+                    new_agent_text_message(_json_dumps(result))
                 )
                 return
             except Exception as handler_error:
@@ -438,4 +473,8 @@ class LiteAgentExecutor(AgentExecutor):
             return await handler(*args, **kwargs)
         else:
             loop = asyncio.get_running_loop()
-            return await loop.run_in_executor(None, lambda: handler(*args, **kwargs))
+            if kwargs:
+                return await loop.run_in_executor(
+                    None, functools.partial(handler, *args, **kwargs)
+                )
+            return await loop.run_in_executor(None, handler, *args)
@@ -28,6 +28,8 @@ from __future__ import annotations
 import functools
 from typing import Any, Callable, Optional
 
+from .utils import _get_http_client
+
 
 def openai_skill(
     model: str = "gpt-4o-mini",
@@ -233,7 +235,8 @@ def ollama_skill(
     """Decorator that wraps a skill to call a local Ollama instance.
 
     Uses httpx (already a core dep) to call the Ollama HTTP API directly,
-    so no additional packages are required.
+    so no additional packages are required. Calls share one pooled client
+    per event loop, so repeated requests reuse keep-alive connections.
 
     Args:
         model: Ollama model name.
@@ -257,8 +260,6 @@ def ollama_skill(
 
             @functools.wraps(func)
             async def streaming_wrapper(**kwargs: Any):  # type: ignore[misc]
-                import httpx
-
                 user_message = _extract_user_message(kwargs)
                 url = f"{base_url.rstrip('/')}/api/chat"
                 payload = {
@@ -271,26 +272,24 @@ def ollama_skill(
                     "options": {"temperature": temperature},
                 }
 
-                async with httpx.AsyncClient() as client:
-                    async with client.stream(
-                        "POST", url, json=payload, timeout=120.0
-                    ) as response:
-                        import json as _json
+                client = _get_http_client()
+                async with client.stream(
+                    "POST", url, json=payload, timeout=120.0
+                ) as response:
+                    import json as _json
 
-                        async for line in response.aiter_lines():
-                            if line.strip():
-                                data = _json.loads(line)
-                                content = data.get("message", {}).get("content", "")
-                                if content:
-                                    yield content
+                    async for line in response.aiter_lines():
+                        if line.strip():
+                            data = _json.loads(line)
+                            content = data.get("message", {}).get("content", "")
+                            if content:
+                                yield content
 
             return streaming_wrapper
         else:
 
             @functools.wraps(func)
             async def wrapper(**kwargs: Any) -> str:
-                import httpx
-
                 user_message = _extract_user_message(kwargs)
                 url = f"{base_url.rstrip('/')}/api/chat"
                 payload = {
@@ -303,17 +302,21 @@ def ollama_skill(
                     "options": {"temperature": temperature},
                 }
 
-                async with httpx.AsyncClient() as client:
-                    response = await client.post(url, json=payload, timeout=120.0)
-                    response.raise_for_status()
-                    data = response.json()
-                    return data.get("message", {}).get("content", "")
+                client = _get_http_client()
+                response = await client.post(url, json=payload, timeout=120.0)
+                response.raise_for_status()
+                data = response.json()
+                return data.get("message", {}).get("content", "")
 
             return wrapper
 
     return decorator
 
 
+# Parameter names checked, in priority order, for the user message
+_MESSAGE_KEYS = ("message", "text", "query", "prompt", "input")
+
+
 def _extract_user_message(kwargs: dict[str, Any]) -> str:
     """Extract the user message from skill kwargs.
 
@@ -326,7 +329,7 @@ def _extract_user_message(kwargs: dict[str, Any]) -> str:
     Returns:
         The user message string.
     """
-    for key in ("message", "text", "query", "prompt", "input"):
+    for key in _MESSAGE_KEYS:
         if key in kwargs:
             return str(kwargs[key])
     # Fallback: use the first string value
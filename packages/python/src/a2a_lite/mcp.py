@@ -16,11 +16,34 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+from collections import defaultdict
 from typing import Any, Dict, List, Optional
 
+from .utils import _MISSING
+
 logger = logging.getLogger(__name__)
 
+# Exception class names that always mean "tool not found"
+_NOT_FOUND_TYPE_NAMES = frozenset(
+    {"ToolNotFoundError", "UnknownToolError", "MethodNotFoundError"}
+)
+
+# Error codes (string or JSON-RPC) that mean "tool not found"
+_NOT_FOUND_CODES = frozenset({"TOOL_NOT_FOUND", "METHOD_NOT_FOUND", -32601})
+
+# Message fragments that indicate a missing tool, most specific first
+_NOT_FOUND_PATTERNS = (
+    "unknown tool",
+    "tool not found",
+    "tool '",
+    'tool "',
+    "no tool named",
+    "tool does not exist",
+)
+
 
 class MCPError(Exception):
     """Base exception for MCP-related errors."""
@@ -50,6 +73,10 @@ class MCPClient:
     def __init__(self, server_urls: Optional[List[str]] = None) -> None:
         self._server_urls: List[str] = list(server_urls) if server_urls else []
         self._sessions: Dict[str, Any] = {}
+        # One lock per URL so concurrent callers don't open duplicate sessions
+        self._session_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # Tool catalog per URL, fetched on first list_tools()
+        self._tools_cache: dict[str, list[dict[str, Any]]] = {}
 
     def add_server(self, url: str) -> None:
         """Add an MCP server URL.
@@ -71,23 +98,30 @@ class MCPClient:
         Raises:
             ImportError: If the ``mcp`` package is not installed.
         """
-        if url in self._sessions:
-            return self._sessions[url]
-
-        try:
-            from mcp import ClientSession
-            from mcp.client.sse import sse_client
-        except ImportError:
-            raise ImportError(
-                "MCP integration requires the 'mcp' package. "
-                "Install it with: pip install a2a-lite[mcp]"
-            )
-
-        read_stream, write_stream = sse_client(url)
-        session = ClientSession(read_stream, write_stream)
-        await session.initialize()
-        self._sessions[url] = session
-        return session
+        session = self._sessions.get(url)
+        if session is not None:
+            return session
+
+        async with self._session_locks[url]:
+            # Another caller may have opened it while we waited for the lock
+            session = self._sessions.get(url)
+            if session is not None:
+                return session
+
+            try:
+                from mcp import ClientSession
+                from mcp.client.sse import sse_client
+            except ImportError:
+                raise ImportError(
+                    "MCP integration requires the 'mcp' package. "
+                    "Install it with: pip install a2a-lite[mcp]"
+                )
+
+            read_stream, write_stream = sse_client(url)
+            session = ClientSession(read_stream, write_stream)
+            await session.initialize()
+            self._sessions[url] = session
+            return session
 
     async def call_tool(
         self,
@@ -151,29 +185,22 @@ class MCPClient:
             True if the error indicates the tool was not found.
         """
         # Try to detect specific MCP SDK exception types
-        error_type = type(error).__name__.lower()
+        type_name = type(error).__name__
+        if type_name in _NOT_FOUND_TYPE_NAMES:
+            return True
+        error_type = type_name.lower()
         if "tool" in error_type and ("notfound" in error_type or "missing" in error_type):
             return True
 
         # Check for common error attributes (some SDKs use error codes)
-        if hasattr(error, "code"):
-            code = getattr(error, "code", None)
-            if code in ("TOOL_NOT_FOUND", "METHOD_NOT_FOUND", -32601):
-                return True
+        code = getattr(error, "code", None)
+        if isinstance(code, (str, int)) and code in _NOT_FOUND_CODES:
+            return True
 
         # Check error message as last resort (more specific patterns first)
         error_str = str(error).lower()
-        specific_patterns = [
-            "unknown tool",
-            "tool not found",
-            "tool '",
-            'tool "',
-            "no tool named",
-            "tool does not exist",
-        ]
-        for pattern in specific_patterns:
-            if pattern in error_str:
-                return True
+        if any(pattern in error_str for pattern in _NOT_FOUND_PATTERNS):
+            return True
 
         # Generic "not found" only if tool is mentioned
         if "not found" in error_str and "tool" in error_str:
@@ -187,6 +214,13 @@ class MCPClient:
     ) -> List[Dict[str, Any]]:
         """List available tools from MCP servers.
 
+        Servers are queried concurrently; results keep the order in which
+        the servers were registered. A server that fails is logged and
+        skipped so it doesn't hide the tools of the others.
+
+        Each server's catalog is cached after the first successful listing;
+        call ``invalidate_tools()`` to pick up tools that changed since.
+
         Args:
             server_url: If provided, list tools from this server only.
 
@@ -194,28 +228,57 @@ class MCPClient:
             List of tool descriptors with name, description, and input schema.
         """
         urls = [server_url] if server_url else self._server_urls
-        all_tools: List[Dict[str, Any]] = []
+        results = await asyncio.gather(
+            *(self._list_server_tools(url) for url in urls),
+            return_exceptions=True,
+        )
 
-        for url in urls:
-            try:
-                session = await self._get_session(url)
-                response = await session.list_tools()
-                for tool in response.tools:
-                    all_tools.append(
-                        {
-                            "name": tool.name,
-                            "description": getattr(tool, "description", ""),
-                            "input_schema": getattr(tool, "inputSchema", {}),
-                            "server_url": url,
-                        }
-                    )
-            except ImportError:
-                raise
-            except Exception:
-                logger.warning("Failed to list tools from %s", url, exc_info=True)
+        all_tools: List[Dict[str, Any]] = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, ImportError) or not isinstance(
+                    result, Exception
+                ):
+                    raise result
+                logger.warning(
+                    "Failed to list tools from %s", url, exc_info=result
+                )
+                continue
+            all_tools.extend(result)
 
         return all_tools
 
+    def invalidate_tools(self, server_url: str | None = None) -> None:
+        """Drop cached tool listings so the next ``list_tools()`` refetches.
+
+        Args:
+            server_url: If provided, only forget this server's tools.
+        """
+        if server_url is None:
+            self._tools_cache.clear()
+        else:
+            self._tools_cache.pop(server_url, None)
+
+    async def _list_server_tools(self, url: str) -> list[dict[str, Any]]:
+        """List the tools of a single MCP server, from cache when known."""
+        tools = self._tools_cache.get(url)
+        if tools is not None:
+            # Copied so callers can't edit the cached catalog
+            return copy.deepcopy(tools)
+
+        session = await self._get_session(url)
+        response = await session.list_tools()
+        tools = self._tools_cache[url] = [
+            {
+                "name": tool.name,
+                "description": getattr(tool, "description", ""),
+                "input_schema": getattr(tool, "inputSchema", {}),
+                "server_url": url,
+            }
+            for tool in response.tools
+        ]
+        return copy.deepcopy(tools)
+
     async def read_resource(
         self,
         uri: str,
@@ -240,12 +303,27 @@ class MCPClient:
 
     async def close(self) -> None:
         """Close all MCP sessions."""
-        for url, session in self._sessions.items():
+        self._tools_cache.clear()
+        # Close concurrently so shutdown waits for the slowest server only
+        await asyncio.gather(
+            *(self._close_session(url) for url in list(self._sessions))
+        )
+
+    async def _close_session(self, url: str) -> None:
+        """Close one session, logging instead of raising on failure.
+
+        Runs under the URL's session lock, which is kept afterwards: a
+        concurrent _get_session then waits and opens a fresh session once
+        this one is closed, rather than racing it on a second lock.
+        """
+        async with self._session_locks[url]:
+            session = self._sessions.pop(url, None)
+            if session is None:
+                return
             try:
                 await session.close()
             except Exception:
                 logger.warning("Error closing MCP session for %s", url, exc_info=True)
-        self._sessions.clear()
 
     async def __aenter__(self) -> "MCPClient":
         """Enter async context manager."""
@@ -268,12 +346,11 @@ def _extract_mcp_content(result: Any) -> Any:
     Returns:
         The extracted content as a string or list.
     """
-    if hasattr(result, "content"):
-        contents = result.content
-        if len(contents) == 1:
-            item = contents[0]
-            if hasattr(item, "text"):
-                return item.text
-            return item
-        return [c.text if hasattr(c, "text") else c for c in contents]
-    return result
+    # getattr with a default does one attribute lookup instead of hasattr + get
+    contents = getattr(result, "content", _MISSING)
+    if contents is _MISSING:
+        return result
+    if len(contents) == 1:
+        item = contents[0]
+        return getattr(item, "text", item)
+    return [getattr(c, "text", c) for c in contents]
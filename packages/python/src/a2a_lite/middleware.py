@@ -15,6 +15,7 @@ Example:
 
 from __future__ import annotations
 
+from collections.abc import Awaitable
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 import asyncio
@@ -48,10 +49,38 @@ class MiddlewareChain:
 
     def __init__(self):
         self._middlewares: List[Callable] = []
+        # (final_handler, composed callable) from the last compile()
+        self._compiled: tuple[Callable, Callable] | None = None
 
     def add(self, middleware: Callable) -> None:
         """Add a middleware function to the chain."""
         self._middlewares.append(middleware)
+        self._compiled = None
+
+    def compile(self, final_handler: Callable) -> Callable[[MiddlewareContext], Awaitable[Any]]:
+        """
+        Fold the middleware list around a final handler into one callable.
+
+        The result takes a MiddlewareContext and is cached until the chain
+        changes or a different final handler is passed, so callers that reuse
+        the same handler (e.g. a bound method) compose the chain only once.
+
+        Args:
+            final_handler: Async callable taking the context
+
+        Returns:
+            An async callable running every middleware, then the final handler
+        """
+        compiled = self._compiled
+        if compiled is not None and compiled[0] == final_handler:
+            return compiled[1]
+
+        call = final_handler
+        for middleware in reversed(self._middlewares):
+            call = self._compose(middleware, call)
+
+        self._compiled = (final_handler, call)
+        return call
 
     async def execute(
         self,
@@ -68,33 +97,24 @@ class MiddlewareChain:
         Returns:
             The result from the handler (possibly modified by middleware)
         """
-
-        # Build the chain from the end
-        async def call_final():
+        if not self._middlewares:
             return await final_handler(context)
+        return await self.compile(final_handler)(context)
 
-        # Wrap each middleware around the next
-        next_fn = call_final
-        for middleware in reversed(self._middlewares):
-            next_fn = self._wrap_middleware(middleware, context, next_fn)
+    @staticmethod
+    def _compose(middleware: Callable, call_next: Callable) -> Callable:
+        """Wrap one middleware around the rest of the chain."""
+        if asyncio.iscoroutinefunction(middleware):
 
-        return await next_fn()
+            async def layer(context: MiddlewareContext) -> Any:
+                return await middleware(context, lambda: call_next(context))
 
-    def _wrap_middleware(
-        self,
-        middleware: Callable,
-        context: MiddlewareContext,
-        next_fn: Callable,
-    ) -> Callable:
-        """Wrap a middleware function."""
+        else:
 
-        async def wrapped():
-            if asyncio.iscoroutinefunction(middleware):
-                return await middleware(context, next_fn)
-            else:
-                return middleware(context, next_fn)
+            async def layer(context: MiddlewareContext) -> Any:
+                return middleware(context, lambda: call_next(context))
 
-        return wrapped
+        return layer
 
 
 # Built-in middleware helpers
@@ -112,13 +132,13 @@ def logging_middleware(logger=None):
     log = logger or logging.getLogger("a2a_lite")
 
     async def middleware(ctx: MiddlewareContext, next):
-        log.info(f"Calling skill: {ctx.skill} with params: {ctx.params}")
+        log.info("Calling skill: %s with params: %s", ctx.skill, ctx.params)
         try:
             result = await next()
-            log.info(f"Skill {ctx.skill} returned successfully")
+            log.info("Skill %s returned successfully", ctx.skill)
             return result
         except Exception as e:
-            log.error(f"Skill {ctx.skill} failed: {e}")
+            log.error("Skill %s failed: %s", ctx.skill, e)
             raise
 
     return middleware
@@ -131,35 +151,46 @@ def timing_middleware():
     Example:
         agent.add_middleware(timing_middleware())
     """
-    import time
+    from time import perf_counter_ns
 
     async def middleware(ctx: MiddlewareContext, next):
-        start = time.perf_counter()
+        start = perf_counter_ns()
         result = await next()
-        elapsed = time.perf_counter() - start
-        ctx.metadata["execution_time_ms"] = round(elapsed * 1000, 2)
+        elapsed_ns = perf_counter_ns() - start
+        ctx.metadata["execution_time_ms"] = round(elapsed_ns / 1_000_000, 2)
         return result
 
     return middleware
 
 
-def retry_middleware(max_retries: int = 3, delay: float = 1.0):
+def retry_middleware(
+    max_retries: int = 3,
+    delay: float = 1.0,
+    max_delay: float = 30.0,
+    retry_on: tuple[type, ...] = (Exception,),
+):
     """
     Create a retry middleware for failed skill calls.
 
+    Waits between attempts double from ``delay`` up to ``max_delay``, with
+    random jitter so concurrent callers don't retry in lockstep. Only
+    exceptions matching ``retry_on`` are retried; others propagate at once.
+
     Example:
         agent.add_middleware(retry_middleware(max_retries=3))
     """
+    import random
 
     async def middleware(ctx: MiddlewareContext, next):
         last_error = None
         for attempt in range(max_retries):
             try:
                 return await next()
-            except Exception as e:
+            except retry_on as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    await asyncio.sleep(delay * (attempt + 1))
+                    backoff = min(delay * (2**attempt), max_delay)
+                    await asyncio.sleep(backoff * (0.5 + random.random() / 2))
         raise last_error
 
     return middleware
@@ -176,21 +207,30 @@ def rate_limit_middleware(requests_per_minute: int = 60):
 
     Example:
         agent.add_middleware(rate_limit_middleware(requests_per_minute=100))
+
+    Raises:
+        ValueError: If requests_per_minute is less than 1.
     """
+    if requests_per_minute < 1:
+        raise ValueError(
+            f"requests_per_minute must be at least 1, got {requests_per_minute}"
+        )
+
     import time
     from collections import deque
 
-    request_times = deque()
+    # Only the last ``requests_per_minute`` admissions matter: the limit is
+    # hit exactly when the oldest of them is still inside the window, so a
+    # bounded deque replaces pruning with a single comparison.
+    request_times = deque(maxlen=requests_per_minute)
 
     async def middleware(ctx: MiddlewareContext, next):
-        now = time.time()
-        minute_ago = now - 60
-
-        # Remove old requests
-        while request_times and request_times[0] < minute_ago:
-            request_times.popleft()
+        now = time.monotonic()
 
-        if len(request_times) >= requests_per_minute:
+        if (
+            len(request_times) == requests_per_minute
+            and request_times[0] >= now - 60
+        ):
             raise RateLimitExceeded(
                 f"Rate limit exceeded: {requests_per_minute} requests per minute"
             )
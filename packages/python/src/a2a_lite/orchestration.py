@@ -27,8 +27,21 @@ import logging
 from typing import Any, Dict, Optional
 from uuid import uuid4
 
+from .utils import (
+    _MISSING,
+    _close_http_client,
+    _get_http_client,
+    _json_dumps,
+    _json_loads,
+)
+
 logger = logging.getLogger(__name__)
 
+# First characters a JSON document can start with; other text is returned
+# as-is without attempting (and failing) a parse. 'N' and 'I' cover the
+# NaN/Infinity constants json.loads accepts.
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
 
 class AgentNetwork:
     """Registry of named remote A2A agents.
@@ -123,6 +136,8 @@ class AgentNetwork:
         self,
         skill: str,
         timeout: float = 30.0,
+        *,
+        broadcast_concurrency: int | None = None,
         **params: Any,
     ) -> Dict[str, Any]:
         """Call the same skill on all agents in the network concurrently.
@@ -130,25 +145,72 @@ class AgentNetwork:
         Args:
             skill: The skill to invoke on each agent.
             timeout: Request timeout in seconds.
+            broadcast_concurrency: Maximum number of requests in flight at
+                once. None (the default) calls every agent at the same time.
             **params: Parameters to pass to the skill.
 
+        Raises:
+            ValueError: If broadcast_concurrency is less than 1.
+
         Returns:
             Dict mapping agent names to their results (or error dicts).
         """
-        tasks = {
-            name: _call_remote_skill(url, skill, params, timeout)
-            for name, url in self._agents.items()
-        }
+        names = list(self._agents)
+        results = await _call_bounded(
+            [(url, skill, params) for url in self._agents.values()],
+            timeout,
+            broadcast_concurrency,
+        )
+        return dict(zip(names, results))
+
+    async def call_many(
+        self,
+        calls: list[tuple[str, str, dict[str, Any]]],
+        timeout: float = 30.0,
+        max_concurrency: int = 10,
+    ) -> list[Any]:
+        """Call several independent agent skills concurrently.
 
-        results: Dict[str, Any] = {}
-        gathered = await asyncio.gather(*tasks.values(), return_exceptions=True)
-        for name, result in zip(tasks.keys(), gathered):
-            if isinstance(result, Exception):
-                results[name] = {"error": str(result), "type": type(result).__name__}
-            else:
-                results[name] = result
+        Args:
+            calls: (agent name, skill, params) tuples to invoke.
+            timeout: Request timeout in seconds for each call.
+            max_concurrency: Maximum number of requests in flight at once.
 
-        return results
+        Returns:
+            Results in the same order as ``calls``. Failed calls yield an
+            error dict, as in broadcast().
+
+        Raises:
+            KeyError: If any agent name is not registered. Raised before any
+                request is sent.
+            ValueError: If max_concurrency is less than 1.
+
+        Example:
+            weather, hotels = await network.call_many([
+                ("weather", "forecast", {"city": "NYC"}),
+                ("hotels", "search", {"city": "NYC"}),
+            ])
+        """
+        resolved = []
+        for name, skill, params in calls:
+            url = self._agents.get(name)
+            if url is None:
+                raise KeyError(
+                    f"Agent '{name}' not found in network. "
+                    f"Available: {list(self._agents.keys())}"
+                )
+            resolved.append((url, skill, params))
+
+        return await _call_bounded(resolved, timeout, max_concurrency)
+
+    async def close(self) -> None:
+        """Close the pooled HTTP client used for remote calls on this event loop.
+
+        Remote calls share one connection pool per event loop, so call this
+        when shutting down to release open connections. A later call opens
+        a fresh pool.
+        """
+        await _close_http_client()
 
     def __len__(self) -> int:
         return len(self._agents)
@@ -160,6 +222,40 @@ class AgentNetwork:
         return f"AgentNetwork(agents={list(self._agents.keys())})"
 
 
+async def _call_bounded(
+    calls: list[tuple[str, str, dict[str, Any]]],
+    timeout: float,
+    max_concurrency: int | None,
+) -> list[Any]:
+    """Run (url, skill, params) calls concurrently, at most max_concurrency at once.
+
+    None means no limit. Results keep the order of ``calls``; a failed call
+    yields an error dict. Raises ValueError if the limit is below 1, which
+    would never start a call.
+    """
+    if max_concurrency is None:
+        call = _call_remote_skill
+    elif max_concurrency < 1:
+        raise ValueError(f"Concurrency limit must be at least 1, got {max_concurrency}")
+    else:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def call(url: str, skill: str, params: dict[str, Any], timeout: float) -> Any:
+            async with semaphore:
+                return await _call_remote_skill(url, skill, params, timeout)
+
+    gathered = await asyncio.gather(
+        *(call(url, skill, params, timeout) for url, skill, params in calls),
+        return_exceptions=True,
+    )
+    return [
+        {"error": str(result), "type": type(result).__name__}
+        if isinstance(result, Exception)
+        else result
+        for result in gathered
+    ]
+
+
 async def _call_remote_skill(
     agent_url: str,
     skill: str,
@@ -177,9 +273,7 @@ async def _call_remote_skill(
     Returns:
         The parsed result value from the remote agent.
     """
-    import httpx
-
-    message = json.dumps({"skill": skill, "params": params})
+    message = _json_dumps({"skill": skill, "params": params}, default=None)
     request_body = {
         "jsonrpc": "2.0",
         "method": "message/send",
@@ -193,10 +287,11 @@ async def _call_remote_skill(
         },
     }
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        response = await client.post(agent_url, json=request_body)
-        response.raise_for_status()
-        data = response.json()
+    # Keep-alive connections are reused across calls, e.g. a broadcast fan-out
+    client = _get_http_client()
+    response = await client.post(agent_url, json=request_body, timeout=timeout)
+    response.raise_for_status()
+    data = _json_loads(response.content)
 
     return _extract_result(data)
 
@@ -210,17 +305,21 @@ def _extract_result(response: Dict[str, Any]) -> Any:
     Returns:
         The parsed result value (dict, str, etc.).
     """
-    if "error" in response:
-        return response["error"]
-
-    result = response.get("result", {})
-    parts = result.get("parts", [])
-
-    for part in parts:
-        if part.get("kind") == "text" or part.get("type") == "text":
-            text = part.get("text", "")
+    get = response.get
+    error = get("error", _MISSING)
+    if error is not _MISSING:
+        return error
+
+    result = get("result", {})
+
+    for part in result.get("parts", ()):
+        part_get = part.get
+        if part_get("kind") == "text" or part_get("type") == "text":
+            text = part_get("text", "")
+            if text.lstrip()[:1] not in _JSON_START_CHARS:
+                return text
             try:
-                return json.loads(text)
+                return _json_loads(text)
             except json.JSONDecodeError:
                 return text
 
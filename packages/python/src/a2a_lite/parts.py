@@ -20,13 +20,14 @@ Example (with files - opt-in):
 
 from __future__ import annotations
 
-import base64
+import binascii
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Union
 from pathlib import Path
 
 
-@dataclass
+@dataclass(slots=True)
 class TextPart:
     """Simple text content."""
 
@@ -40,8 +41,20 @@ class TextPart:
         return cls(text=data.get("text", ""))
 
 
-@dataclass
-class FilePart:
+class _EncodedSlot:
+    """
+    Private ``_encoded`` slot for FilePart, kept out of its dataclass fields
+    (and so out of fields(), asdict(), repr and ==).
+
+    Holds (data, base64 text) from the last to_a2a(); bytes are immutable, so
+    the encoding stays valid for as long as ``data`` is the same object.
+    """
+
+    __slots__ = ("_encoded",)
+
+
+@dataclass(slots=True)
+class FilePart(_EncodedSlot):
     """
     File content - can be bytes or a URI.
 
@@ -105,10 +118,22 @@ class FilePart:
                 "file": {
                     "name": self.name,
                     "mimeType": self.mime_type,
-                    "bytes": base64.b64encode(self.data or b"").decode(),
+                    "bytes": self._encoded_data(),
                 },
             }
 
+    def _encoded_data(self) -> str:
+        """Base64 text of ``data``, encoded once per bytes object."""
+        data = self.data or b""
+        cached = getattr(self, "_encoded", None)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+        encoded = binascii.b2a_base64(data, newline=False).decode("ascii")
+        # bytearray/memoryview can change in place, so only bytes are cached
+        if type(data) is bytes:
+            self._encoded = (data, encoded)
+        return encoded
+
     @classmethod
     def from_a2a(cls, data: Dict) -> "FilePart":
         file_data = data.get("file", {})
@@ -116,7 +141,7 @@ class FilePart:
         return cls(
             name=file_data.get("name", "unknown"),
             mime_type=file_data.get("mimeType", "application/octet-stream"),
-            data=base64.b64decode(bytes_data) if bytes_data else None,
+            data=binascii.a2b_base64(bytes_data) if bytes_data else None,
             uri=file_data.get("uri"),
         )
 
@@ -137,7 +162,7 @@ class FilePart:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class DataPart:
     """
     Structured JSON data.
@@ -202,6 +227,13 @@ class Artifact:
         self.parts.append(DataPart(data=data))
         return self
 
+    def add_parts(
+        self, parts: Iterable[TextPart | FilePart | DataPart]
+    ) -> Artifact:
+        """Add several parts at once."""
+        self.parts.extend(parts)
+        return self
+
     def to_a2a(self) -> Dict[str, Any]:
         return {
             "name": self.name,
@@ -211,17 +243,19 @@ class Artifact:
         }
 
 
+# Part parsers keyed by the A2A "type"/"kind" value
+_PART_PARSERS = {
+    "text": TextPart.from_a2a,
+    "file": FilePart.from_a2a,
+    "data": DataPart.from_a2a,
+}
+
+
 # Helper to parse incoming parts
 def parse_part(data: Dict) -> Union[TextPart, FilePart, DataPart]:
     """Parse an A2A part dict into the appropriate Part type."""
-    part_type = data.get("type") or data.get("kind")
-
-    if part_type == "text":
-        return TextPart.from_a2a(data)
-    elif part_type == "file":
-        return FilePart.from_a2a(data)
-    elif part_type == "data":
-        return DataPart.from_a2a(data)
-    else:
+    parser = _PART_PARSERS.get(data.get("type") or data.get("kind"))
+    if parser is None:
         # Default to text
         return TextPart(text=str(data))
+    return parser(data)
@@ -22,14 +22,9 @@ def is_generator_function(func: Callable) -> bool:
 
 async def collect_generator(gen: Union[Generator, AsyncGenerator]) -> list[Any]:
     """Collect all items from a generator into a list."""
-    items = []
     if inspect.isasyncgen(gen):
-        async for item in gen:
-            items.append(item)
-    else:
-        for item in gen:
-            items.append(item)
-    return items
+        return [item async for item in gen]
+    return list(gen)
 
 
 async def stream_generator(
@@ -43,11 +38,12 @@ async def stream_generator(
     """
     from a2a.utils import new_agent_text_message
 
+    enqueue = event_queue.enqueue_event
     if inspect.isasyncgen(gen):
         async for chunk in gen:
-            text = str(chunk) if not isinstance(chunk, str) else chunk
-            await event_queue.enqueue_event(new_agent_text_message(text))
+            text = chunk if isinstance(chunk, str) else str(chunk)
+            await enqueue(new_agent_text_message(text))
     else:
         for chunk in gen:
-            text = str(chunk) if not isinstance(chunk, str) else chunk
-            await event_queue.enqueue_event(new_agent_text_message(text))
+            text = chunk if isinstance(chunk, str) else str(chunk)
+            await enqueue(new_agent_text_message(text))
@@ -29,12 +29,14 @@ Example (with task tracking - opt-in):
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import os
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Callable, Dict, List, Optional
-from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
@@ -51,7 +53,13 @@ class TaskState(str, Enum):
     AUTH_REQUIRED = "auth-required"
 
 
-@dataclass
+# Plain-dict lookups for the per-update conversions; both skip the Enum
+# machinery behind TaskState(value) and TaskState.X.value
+_STATE_BY_VALUE: dict[str, TaskState] = {s.value: s for s in TaskState}
+_STATE_VALUE: dict[TaskState, str] = {s: s.value for s in TaskState}
+
+
+@dataclass(slots=True)
 class TaskStatus:
     """Current status of a task."""
 
@@ -62,14 +70,14 @@ class TaskStatus:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "state": self.state.value,
+            "state": _STATE_VALUE[self.state],
             "message": self.message,
             "progress": self.progress,
             "timestamp": self.timestamp.isoformat(),
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Represents an A2A task."""
 
@@ -83,6 +91,8 @@ class Task:
     history: List[TaskStatus] = field(default_factory=list)
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Keep only this many previous statuses (oldest dropped first); None keeps all
+    max_history: int | None = None
 
     def update_status(
         self,
@@ -91,7 +101,10 @@ class Task:
         progress: Optional[float] = None,
     ) -> None:
         """Update task status."""
-        self.history.append(self.status)
+        history = self.history
+        history.append(self.status)
+        if self.max_history is not None and len(history) > self.max_history:
+            del history[: len(history) - self.max_history]
         self.status = TaskStatus(state=state, message=message, progress=progress)
         self.updated_at = datetime.now(timezone.utc)
 
@@ -114,7 +127,8 @@ class TaskContext:
         self._task = task
         self._event_queue = event_queue
         self._input_handler = input_handler
-        self._status_callbacks: List[Callable] = []
+        # (callback, is_async) pairs, classified once at registration
+        self._status_callbacks: list[tuple[Callable, bool]] = []
 
     @property
     def task_id(self) -> str:
@@ -141,16 +155,20 @@ class TaskContext:
         Example:
             await task.update("working", "Processing item 5/10", progress=0.5)
         """
-        task_state = TaskState(state) if isinstance(state, str) else state
+        if isinstance(state, str):
+            task_state = _STATE_BY_VALUE.get(state) or TaskState(state)
+        else:
+            task_state = state
         self._task.update_status(task_state, message, progress)
 
         # Notify callbacks
-        for callback in self._status_callbacks:
+        status = self._task.status
+        for callback, is_async in self._status_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback(self._task.status)
+                if is_async:
+                    await callback(status)
                 else:
-                    callback(self._task.status)
+                    callback(status)
             except Exception:
                 logger.warning(
                     "Status callback error for task '%s'", self._task.id, exc_info=True
@@ -164,20 +182,26 @@ class TaskContext:
         """Send status update via SSE."""
         if self._event_queue:
             from a2a.utils import new_agent_text_message
-            import json
+            from .utils import _json_dumps
 
-            status_msg = json.dumps(
+            status_msg = _json_dumps(
                 {
                     "_type": "status_update",
                     "task_id": self._task.id,
                     "status": self._task.status.to_dict(),
-                }
+                },
+                default=None,
             )
             await self._event_queue.enqueue_event(new_agent_text_message(status_msg))
 
     def on_status_change(self, callback: Callable) -> None:
         """Register callback for status changes."""
-        self._status_callbacks.append(callback)
+        self._status_callbacks.append(
+            (callback, asyncio.iscoroutinefunction(callback))
+        )
+
+
+_created_at = attrgetter("created_at")
 
 
 class TaskStore:
@@ -185,22 +209,35 @@ class TaskStore:
     In-memory task store with async locking for thread safety.
 
     For production, extend this with Redis/DB backend.
+
+    Args:
+        max_history: Cap on the status history kept per created task.
+            None (the default) keeps the full history.
     """
 
-    def __init__(self):
+    def __init__(self, max_history: int | None = None):
+        self._max_history = max_history
         self._tasks: Dict[str, Task] = {}
+        # Tasks grouped by skill, so list(skill=...) skips unrelated tasks.
+        # State isn't indexed: TaskContext changes it in place on the task.
+        self._by_skill: dict[str, dict[str, Task]] = {}
+        self._indexed_skill: dict[str, str] = {}  # task id -> its _by_skill key
         self._lock = asyncio.Lock()
 
     async def create(self, skill: str, params: Dict[str, Any]) -> Task:
         """Create a new task."""
         async with self._lock:
             task = Task(
-                id=uuid4().hex,
+                # 128 random bits as 32 hex chars, like uuid4().hex but
+                # without building a UUID object
+                id=os.urandom(16).hex(),
                 skill=skill,
                 params=params,
                 status=TaskStatus(state=TaskState.SUBMITTED),
+                max_history=self._max_history,
             )
             self._tasks[task.id] = task
+            self._index(task)
             return task
 
     async def get(self, task_id: str) -> Optional[Task]:
@@ -211,7 +248,9 @@ class TaskStore:
     async def update(self, task: Task) -> None:
         """Update task in store."""
         async with self._lock:
+            self._unindex(task.id)
             self._tasks[task.id] = task
+            self._index(task)
 
     async def list(
         self,
@@ -221,19 +260,43 @@ class TaskStore:
     ) -> List[Task]:
         """List tasks with optional filters."""
         async with self._lock:
-            tasks = list(self._tasks.values())
+            if skill:
+                tasks = self._by_skill.get(skill, {}).values()
+            else:
+                tasks = self._tasks.values()
 
+            # Filtered lazily, so each candidate is visited once
             if state:
-                tasks = [t for t in tasks if t.status.state == state]
-            if skill:
-                tasks = [t for t in tasks if t.skill == skill]
+                tasks = (t for t in tasks if t.status.state == state)
 
-            return sorted(tasks, key=lambda t: t.created_at, reverse=True)[:limit]
+            # Same result as sorted(..., reverse=True)[:limit], without
+            # sorting the whole store when only the newest few are wanted
+            return heapq.nlargest(limit, tasks, key=_created_at)
 
     async def delete(self, task_id: str) -> bool:
         """Delete a task."""
         async with self._lock:
-            if task_id in self._tasks:
-                del self._tasks[task_id]
-                return True
-            return False
+            if self._tasks.pop(task_id, None) is None:
+                return False
+            self._unindex(task_id)
+            return True
+
+    def _index(self, task: Task) -> None:
+        """Add a task to the skill index. Caller must hold the lock."""
+        self._by_skill.setdefault(task.skill, {})[task.id] = task
+        self._indexed_skill[task.id] = task.skill
+
+    def _unindex(self, task_id: str) -> None:
+        """
+        Drop a task from the skill index. Caller must hold the lock.
+
+        Looks up the skill it was indexed under rather than reading
+        task.skill, which may have been changed in place since.
+        """
+        skill = self._indexed_skill.pop(task_id, None)
+        if skill is None:
+            return
+        bucket = self._by_skill[skill]
+        del bucket[task_id]
+        if not bucket:
+            del self._by_skill[skill]
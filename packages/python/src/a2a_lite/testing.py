@@ -13,11 +13,17 @@ Makes testing agents as simple as:
 
 from __future__ import annotations
 
+import inspect
 import json
 from dataclasses import dataclass
 from typing import Any, Dict
 from uuid import uuid4
 
+from .utils import _MISSING, _json_dumps, _json_loads
+
+# Request bodies are pre-encoded with _json_dumps rather than httpx's json=
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 @dataclass
 class TestResult:
@@ -46,8 +52,15 @@ class TestResult:
         return self._text
 
     def json(self) -> Any:
-        """Parse the text as JSON."""
-        return json.loads(self._text)
+        """
+        Parse the text as JSON.
+
+        A dict or list result was already parsed from the text, so it is
+        returned as is (the same object as .data) instead of parsed again.
+        """
+        if isinstance(self._data, (dict, list)):
+            return self._data
+        return _json_loads(self._text)
 
     def __eq__(self, other: Any) -> bool:
         """Allow direct comparison with the data value for convenience."""
@@ -111,7 +124,7 @@ class AgentTestClient:
         """
         client = self._get_client()
 
-        message = json.dumps({"skill": skill, "params": params})
+        message = _json_dumps({"skill": skill, "params": params}, default=None)
         request_body = {
             "jsonrpc": "2.0",
             "method": "message/send",
@@ -125,33 +138,37 @@ class AgentTestClient:
             },
         }
 
-        response = client.post("/", json=request_body)
+        response = client.post(
+            "/", content=_json_dumps(request_body, default=None), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         # Extract the actual result from A2A response
         return self._extract_result(data)
 
     def _extract_result(self, response: Dict) -> TestResult:
         """Extract the skill result from A2A response."""
-        if "error" in response:
-            raise TestClientError(response["error"])
+        get = response.get
+        error = get("error", _MISSING)
+        if error is not _MISSING:
+            raise TestClientError(error)
 
-        result = response.get("result", {})
+        result = get("result", {})
 
         # Get text from message parts
-        parts = result.get("parts", [])
-        for part in parts:
-            if part.get("kind") == "text" or part.get("type") == "text":
-                text = part.get("text", "")
+        for part in result.get("parts", ()):
+            part_get = part.get
+            if part_get("kind") == "text" or part_get("type") == "text":
+                text = part_get("text", "")
                 # Try to parse as JSON
                 try:
-                    data = json.loads(text)
+                    data = _json_loads(text)
                 except json.JSONDecodeError:
                     data = text
                 return TestResult(_data=data, _text=text, raw_response=response)
 
-        return TestResult(_data=result, _text=json.dumps(result), raw_response=response)
+        return TestResult(_data=result, _text=_json_dumps(result, default=None), raw_response=response)
 
     def get_agent_card(self) -> Dict[str, Any]:
         """
@@ -198,6 +215,10 @@ class AgentTestClient:
         if not skill_def:
             raise TestClientError(f"Unknown skill: {skill}")
 
+        # Sync generators need no event loop at all
+        if inspect.isgeneratorfunction(skill_def.handler):
+            return list(skill_def.handler(**params))
+
         # Call handler directly and collect results
         results = []
 
@@ -278,7 +299,7 @@ class AsyncAgentTestClient:
         """
         client = await self._get_client()
 
-        message = json.dumps({"skill": skill, "params": params})
+        message = _json_dumps({"skill": skill, "params": params}, default=None)
         request_body = {
             "jsonrpc": "2.0",
             "method": "message/send",
@@ -292,30 +313,16 @@ class AsyncAgentTestClient:
             },
         }
 
-        response = await client.post("/", json=request_body)
+        response = await client.post(
+            "/", content=_json_dumps(request_body, default=None), headers=_JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
 
         return self._extract_result(data)
 
-    def _extract_result(self, response: Dict) -> TestResult:
-        """Extract the skill result from A2A response."""
-        if "error" in response:
-            raise TestClientError(response["error"])
-
-        result = response.get("result", {})
-        parts = result.get("parts", [])
-
-        for part in parts:
-            if part.get("kind") == "text" or part.get("type") == "text":
-                text = part.get("text", "")
-                try:
-                    data = json.loads(text)
-                except json.JSONDecodeError:
-                    data = text
-                return TestResult(_data=data, _text=text, raw_response=response)
-
-        return TestResult(_data=result, _text=json.dumps(result), raw_response=response)
+    # Response decoding is identical for sync and async clients
+    _extract_result = AgentTestClient._extract_result
 
     async def close(self):
         """Close the client."""
@@ -2,13 +2,120 @@
 Helper functions for A2A Lite.
 """
 
+import asyncio
+import copy
+import inspect
+import json
 import logging
+import re
 import typing
-from typing import Any, Dict, Type, get_origin, get_args, Union
-import inspect
+import weakref
+from collections.abc import Callable
+from types import UnionType
+from typing import Any, Dict, Type, Union, get_args, get_origin
+
+try:
+    import orjson
+except ImportError:  # Optional speedup: pip install a2a-lite[fast]
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Sentinel distinguishing a missing key or attribute from one whose value is None
+_MISSING = object()
+
+
+# orjson silently turns integers outside the 64-bit range into floats, so
+# any run of 19+ digits sends the payload to json.loads instead. Matching
+# digits inside strings or fractions only costs a slower parse.
+_LONG_DIGITS = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def _json_loads(data: str | bytes) -> Any:
+    """
+    Parse JSON text or bytes like json.loads, using orjson when it is installed.
+
+    Payloads orjson would parse differently go to json.loads: integers wider
+    than 64 bits, and input orjson rejects (e.g. NaN and Infinity). Invalid
+    JSON raises json.JSONDecodeError with either backend.
+    """
+    if orjson is not None:
+        if isinstance(data, str):
+            long_digits = _LONG_DIGITS.search(data)
+        else:
+            long_digits = _LONG_DIGITS_BYTES.search(data)
+        if long_digits is None:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def _json_dumps(
+    obj: Any, indent: bool = False, default: Callable[[Any], Any] | None = str
+) -> str:
+    """
+    Serialize to JSON text like json.dumps(obj, default=default), using orjson when installed.
+
+    With indent=True the output is indented by two spaces. Datetimes and
+    dataclasses are handed to default as with the stdlib, and anything orjson
+    rejects (e.g. integers wider than 64 bits) falls back to json.dumps, so
+    default=None raises TypeError for unsupported values just like json.dumps.
+
+    The orjson output is not byte-for-byte the stdlib's. Besides compact
+    separators, it differs in three ways:
+
+    - Non-ASCII text is written as raw UTF-8 (``"café"``) rather than
+      escaped as with the stdlib's ensure_ascii=True (``"caf\\u00e9"``).
+      Both decode to the same string.
+    - Enum members that aren't str/int subclasses become their value
+      (``1``) rather than default's result (``"Color.RED"`` with default=str).
+    - NaN and infinities become ``null`` rather than the non-standard
+      ``NaN``/``Infinity`` tokens.
+    """
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None, default=default)
+
+
+# Pooled httpx.AsyncClient for outbound calls (remote agents, Ollama), one
+# per event loop since clients can't be shared across loops; entries go away
+# with their loop
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_http_client() -> Any:
+    """Return the running loop's shared httpx.AsyncClient, creating it on first use."""
+    import httpx
+
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient()
+        _http_clients[loop] = client
+    return client
+
+
+async def _close_http_client() -> None:
+    """Close the running loop's pooled client; the next call opens a new one."""
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
 
 def _is_or_subclass(hint: Any, target_class: Type) -> bool:
     """
@@ -17,9 +124,9 @@ def _is_or_subclass(hint: Any, target_class: Type) -> bool:
     Works with raw classes and string annotations.
     Also handles Optional[X] (Union[X, None]) by extracting the inner type.
     """
-    # Handle Optional[X] (Union[X, None]) by extracting the non-None type
+    # Handle Optional[X] (Union[X, None], or X | None) by extracting the non-None type
     origin = get_origin(hint)
-    if origin is Union:
+    if origin is Union or origin is UnionType:
         args = get_args(hint)
         non_none_args = [a for a in args if a is not type(None)]
         if len(non_none_args) == 1:
@@ -36,6 +143,68 @@ def _is_or_subclass(hint: Any, target_class: Type) -> bool:
     return False
 
 
+# JSON Schema for basic types; copied on return so callers can't mutate it
+_BASIC_TYPE_SCHEMAS: dict[Any, dict[str, Any]] = {
+    str: {"type": "string"},
+    int: {"type": "integer"},
+    float: {"type": "number"},
+    bool: {"type": "boolean"},
+    list: {"type": "array"},
+    dict: {"type": "object"},
+    Any: {"type": "object"},
+}
+
+
+# Pydantic model schemas by model class. model_json_schema() regenerates the
+# schema on every call, and the same model often types several skills.
+# Weak keys let models defined in a local scope be collected.
+_MODEL_SCHEMAS: "weakref.WeakKeyDictionary[type, dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _model_json_schema(model: type) -> dict[str, Any]:
+    """Return a copy of a Pydantic model's JSON schema, generated once per model."""
+    try:
+        schema = _MODEL_SCHEMAS.get(model)
+    except TypeError:  # not weak-referenceable
+        return model.model_json_schema()
+    if schema is None:
+        schema = _MODEL_SCHEMAS[model] = model.model_json_schema()
+    return copy.deepcopy(schema)
+
+
+def _union_schema(args: tuple) -> dict[str, Any]:
+    non_none_args = [a for a in args if a is not type(None)]
+    if len(non_none_args) == 1:
+        # This is Optional[X]
+        return type_to_json_schema(non_none_args[0])
+    # Union of multiple types
+    return {"oneOf": [type_to_json_schema(a) for a in args]}
+
+
+def _list_schema(args: tuple) -> dict[str, Any] | None:
+    if not args:
+        return None
+    return {"type": "array", "items": type_to_json_schema(args[0])}
+
+
+def _dict_schema(args: tuple) -> dict[str, Any] | None:
+    if len(args) < 2:
+        return None
+    return {"type": "object", "additionalProperties": type_to_json_schema(args[1])}
+
+
+# Schema builders keyed by get_origin(); a builder returns None when the
+# generic is missing the arguments it needs (e.g. a bare List)
+_GENERIC_SCHEMAS: dict[Any, Callable[[tuple], dict[str, Any] | None]] = {
+    Union: _union_schema,  # Union[X, Y] and Optional[X]
+    UnionType: _union_schema,  # X | Y
+    list: _list_schema,
+    dict: _dict_schema,
+}
+
+
 def type_to_json_schema(python_type: Type) -> Dict[str, Any]:
     """
     Convert Python type to JSON Schema.
@@ -46,45 +215,23 @@ def type_to_json_schema(python_type: Type) -> Dict[str, Any]:
     if python_type is type(None):
         return {"type": "null"}
 
-    # Basic type mapping
-    type_map = {
-        str: {"type": "string"},
-        int: {"type": "integer"},
-        float: {"type": "number"},
-        bool: {"type": "boolean"},
-        list: {"type": "array"},
-        dict: {"type": "object"},
-        Any: {"type": "object"},
-    }
-
     # Check basic types first
-    if python_type in type_map:
-        return type_map[python_type]
+    basic = _BASIC_TYPE_SCHEMAS.get(python_type)
+    if basic is not None:
+        return dict(basic)
 
-    # Handle generic types
+    # Handle generic types; plain classes have no origin and no args
     origin = get_origin(python_type)
-    args = get_args(python_type)
-
-    # Handle Optional (Union[X, None])
-    if origin is Union:
-        non_none_args = [a for a in args if a is not type(None)]
-        if len(non_none_args) == 1:
-            # This is Optional[X]
-            return type_to_json_schema(non_none_args[0])
-        # Union of multiple types
-        return {"oneOf": [type_to_json_schema(a) for a in args]}
-
-    # Handle List[X]
-    if origin is list and args:
-        return {"type": "array", "items": type_to_json_schema(args[0])}
-
-    # Handle Dict[K, V]
-    if origin is dict and len(args) >= 2:
-        return {"type": "object", "additionalProperties": type_to_json_schema(args[1])}
+    if origin is not None:
+        handler = _GENERIC_SCHEMAS.get(origin)
+        if handler is not None:
+            schema = handler(get_args(python_type))
+            if schema is not None:
+                return schema
 
     # Handle Pydantic models
     if hasattr(python_type, "model_json_schema"):
-        return python_type.model_json_schema()
+        return _model_json_schema(python_type)
 
     # Handle dataclasses
     if hasattr(python_type, "__dataclass_fields__"):
@@ -107,19 +254,25 @@ def type_to_json_schema(python_type: Type) -> Dict[str, Any]:
     return {"type": "object"}
 
 
-def extract_function_schemas(func) -> tuple[Dict[str, Any], Dict[str, Any]]:
+def extract_function_schemas(
+    func, hints: dict[str, Any] | None = None
+) -> tuple[dict[str, Any], dict[str, Any]]:
     """
     Extract input and output JSON schemas from a function's type hints.
 
+    Pass hints when they have already been resolved to skip a second
+    typing.get_type_hints call.
+
     Returns:
         Tuple of (input_schema, output_schema)
     """
     sig = inspect.signature(func)
-    try:
-        hints = typing.get_type_hints(func)
-    except Exception as e:
-        logger.debug("Failed to get type hints for %s: %s", func.__name__, e)
-        hints = getattr(func, "__annotations__", {})
+    if hints is None:
+        try:
+            hints = typing.get_type_hints(func)
+        except Exception as e:
+            logger.debug("Failed to get type hints for %s: %s", func.__name__, e)
+            hints = getattr(func, "__annotations__", {})
 
     # Build input schema from parameters
     properties = {}
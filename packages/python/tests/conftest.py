@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the a2a_lite test suite.
+"""
+import pytest
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed (``a2a-lite[fast]``)."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture
+def mcp_client():
+    """A fresh MCPClient pointed at a single local server."""
+    from a2a_lite.mcp import MCPClient
+
+    return MCPClient(server_urls=["http://localhost:5001"])
+
+
+class RecordingEventQueue:
+    """Minimal stand-in for a2a's EventQueue that records enqueued events."""
+
+    __slots__ = ("events",)
+
+    def __init__(self):
+        self.events = []
+
+    async def enqueue_event(self, event):
+        self.events.append(event)
+
+
+@pytest.fixture
+def event_queue():
+    """A fresh RecordingEventQueue for each test."""
+    return RecordingEventQueue()
@@ -398,6 +398,54 @@ def test_get_app_returns_starlette():
     assert hasattr(app, "routes")
 
 
+def test_get_app_is_cached_until_skills_change():
+    """Test that get_app reuses the app and rebuilds after a new skill."""
+    agent = Agent(name="Test", description="Test")
+
+    @agent.skill("first")
+    async def first() -> str:
+        return "ok"
+
+    app = agent.get_app()
+    assert agent.get_app() is app
+
+    @agent.skill("second")
+    async def second() -> str:
+        return "ok"
+
+    assert agent.get_app() is not app
+
+
+async def _noop_middleware(ctx, next):
+    return await next()
+
+
+async def _noop_handler(*args):
+    return None
+
+
+@pytest.mark.parametrize(
+    "register",
+    [
+        lambda agent: agent.skill("late")(_noop_handler),
+        lambda agent: agent.middleware(_noop_middleware),
+        lambda agent: agent.add_middleware(_noop_middleware),
+        lambda agent: agent.on_error(_noop_handler),
+        lambda agent: agent.on_complete(_noop_handler),
+        lambda agent: agent.add_mcp_server("http://localhost:5001"),
+    ],
+    ids=["skill", "middleware", "add_middleware", "on_error", "on_complete", "add_mcp_server"],
+)
+def test_get_app_rebuilt_after_registration(register):
+    """Test that every registration feeding the app invalidates the cached one."""
+    agent = Agent(name="Test", description="Test")
+    app = agent.get_app()
+
+    register(agent)
+
+    assert agent.get_app() is not app
+
+
 def test_get_app_with_cors():
     """Test that get_app includes CORS middleware when configured."""
     agent = Agent(name="Test", description="Test", cors_origins=["http://localhost:3000"])
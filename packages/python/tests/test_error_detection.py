@@ -1,8 +1,9 @@
 """
 Tests for error detection - verifies errors are detected without fragile string matching.
 """
+import types
+
 import pytest
-from unittest.mock import MagicMock, patch
 
 
 class TestErrorDetection:
@@ -40,9 +41,9 @@ class TestErrorDetection:
         """Test that testing client detects error by key presence."""
         from a2a_lite.testing import AgentTestClient, TestClientError
 
-        # Create a mock to test _extract_result directly
-        client = MagicMock()
-        client._extract_result = AgentTestClient._extract_result.__get__(client, MagicMock)
+        # Bind _extract_result to a bare stand-in to test it directly
+        client = types.SimpleNamespace()
+        client._extract_result = AgentTestClient._extract_result.__get__(client, types.SimpleNamespace)
 
         # Error response should raise TestClientError
         error_response = {
@@ -56,12 +57,8 @@ class TestErrorDetection:
 
         assert "Invalid Request" in str(exc_info.value)
 
-    def test_mcp_call_tool_not_found_handling(self):
+    async def test_mcp_call_tool_not_found_handling(self, mcp_client):
         """Test that MCP call_tool properly handles 'not found' errors."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient(server_urls=["http://localhost:5001"])
-
         # Mock _get_session to simulate a tool not found error
         class ToolNotFoundError(Exception):
             pass
@@ -69,13 +66,11 @@ class TestErrorDetection:
         async def mock_get_session(url):
             raise ToolNotFoundError("Tool 'search' not found on server")
 
-        client._get_session = mock_get_session
-
-        import asyncio
+        mcp_client._get_session = mock_get_session
 
         # Should raise ValueError after trying all servers
         with pytest.raises(ValueError, match="Tool 'search' not found on any MCP server"):
-            asyncio.run(client.call_tool("search"))
+            await mcp_client.call_tool("search")
 
     def test_error_detection_not_using_substring_matching(self):
         """Verify that 'error' in dict checks key existence, not substring."""
@@ -110,91 +105,68 @@ class TestErrorDetection:
 
         # Should be detected as error and raise TestClientError
         with pytest.raises(TestClientError):
-            AgentTestClient._extract_result(MagicMock(), json_rpc_error)
+            AgentTestClient._extract_result(types.SimpleNamespace(), json_rpc_error)
 
 
 class TestMCPToolNotFoundDetection:
     """Tests for MCPClient._is_tool_not_found_error method."""
 
-    def test_detects_tool_not_found_by_exception_type(self):
+    def test_detects_tool_not_found_by_exception_type(self, mcp_client):
         """Test detection by exception type name."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient()
-
         class ToolNotFoundError(Exception):
             pass
 
-        assert client._is_tool_not_found_error(ToolNotFoundError("test")) is True
+        assert mcp_client._is_tool_not_found_error(ToolNotFoundError("test")) is True
 
-    def test_detects_by_error_code_attribute(self):
-        """Test detection by error.code attribute."""
-        from a2a_lite.mcp import MCPClient
+    def test_detects_known_exception_names(self, mcp_client):
+        """Test detection of well-known exception names without 'not found' wording."""
+        class UnknownToolError(Exception):
+            pass
 
-        client = MCPClient()
+        assert mcp_client._is_tool_not_found_error(UnknownToolError("test")) is True
 
+    def test_detects_by_error_code_attribute(self, mcp_client):
+        """Test detection by error.code attribute."""
         class CodedError(Exception):
             code = "TOOL_NOT_FOUND"
 
-        assert client._is_tool_not_found_error(CodedError("test")) is True
+        assert mcp_client._is_tool_not_found_error(CodedError("test")) is True
 
-    def test_detects_by_json_rpc_method_not_found(self):
+    def test_detects_by_json_rpc_method_not_found(self, mcp_client):
         """Test detection of JSON-RPC method not found code."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient()
-
         class JsonRpcError(Exception):
             code = -32601
 
-        assert client._is_tool_not_found_error(JsonRpcError("test")) is True
+        assert mcp_client._is_tool_not_found_error(JsonRpcError("test")) is True
 
-    def test_detects_by_specific_message_patterns(self):
+    @pytest.mark.parametrize("message", [
+        "unknown tool",
+        "tool not found",
+        "tool 'search' is missing",
+        'tool "calc" does not exist',
+        "no tool named 'test'",
+    ])
+    def test_detects_by_specific_message_patterns(self, mcp_client, message):
         """Test detection by specific message patterns."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient()
-
-        # Test various specific patterns
-        patterns = [
-            "unknown tool",
-            "tool not found",
-            "tool 'search' is missing",
-            'tool "calc" does not exist',
-            "no tool named 'test'",
-        ]
+        assert mcp_client._is_tool_not_found_error(Exception(message)) is True
 
-        for pattern in patterns:
-            assert client._is_tool_not_found_error(Exception(pattern)) is True, f"Failed for: {pattern}"
-
-    def test_generic_not_found_requires_tool_mention(self):
+    def test_generic_not_found_requires_tool_mention(self, mcp_client):
         """Test that generic 'not found' requires 'tool' in message."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient()
-
         # Should NOT match - no tool mentioned
-        assert client._is_tool_not_found_error(Exception("file not found")) is False
-        assert client._is_tool_not_found_error(Exception("server not found")) is False
+        assert mcp_client._is_tool_not_found_error(Exception("file not found")) is False
+        assert mcp_client._is_tool_not_found_error(Exception("server not found")) is False
 
         # Should match - tool mentioned
-        assert client._is_tool_not_found_error(Exception("tool not found")) is True
-        assert client._is_tool_not_found_error(Exception("Tool xyz not found")) is True
-
-    def test_other_errors_not_detected_as_tool_not_found(self):
+        assert mcp_client._is_tool_not_found_error(Exception("tool not found")) is True
+        assert mcp_client._is_tool_not_found_error(Exception("Tool xyz not found")) is True
+
+    @pytest.mark.parametrize("error", [
+        Exception("connection timeout"),
+        Exception("authentication failed"),
+        Exception("server error"),
+        ValueError("invalid parameter"),
+        RuntimeError("something went wrong"),
+    ])
+    def test_other_errors_not_detected_as_tool_not_found(self, mcp_client, error):
         """Test that other errors are not falsely detected."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient()
-
-        # These should NOT be detected as tool not found
-        other_errors = [
-            Exception("connection timeout"),
-            Exception("authentication failed"),
-            Exception("server error"),
-            ValueError("invalid parameter"),
-            RuntimeError("something went wrong"),
-        ]
-
-        for error in other_errors:
-            assert client._is_tool_not_found_error(error) is False, f"Failed for: {error}"
+        assert mcp_client._is_tool_not_found_error(error) is False
@@ -26,6 +26,12 @@ class TestA2ALiteError:
         err = A2ALiteError("test")
         assert isinstance(err, Exception)
 
+    def test_subclass_response_type(self):
+        class CustomError(A2ALiteError):
+            pass
+
+        assert CustomError("test").to_response()["type"] == "CustomError"
+
 
 class TestSkillNotFoundError:
     def test_basic_message(self):
@@ -89,6 +95,12 @@ class TestParamValidationError:
         assert len(resp["validation_errors"]) == 2
         assert resp["validation_errors"][0]["field"] == "email"
 
+    def test_errors_is_a_list(self):
+        errors = [{"field": "email", "message": "expected str, got int"}]
+        err = ParamValidationError("create_user", errors)
+        assert err.errors == errors
+        assert err.to_response()["validation_errors"] is err.errors
+
     def test_empty_errors(self):
         err = ParamValidationError("test", [])
         resp = err.to_response()
@@ -67,38 +67,29 @@ class TestExceptionHandling:
         # Check that error was logged
         assert "Executor test error" in caplog.text or "Failed to get type hints" in caplog.text
 
-    def test_mcp_list_tools_exception_logged(self, caplog):
+    async def test_mcp_list_tools_exception_logged(self, mcp_client, caplog):
         """Test that MCP list_tools exceptions are properly logged."""
         import logging
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient(server_urls=["http://localhost:5001"])
 
         # Mock _get_session to raise an exception
         async def mock_get_session(url):
             raise Exception("Connection failed")
 
         with caplog.at_level(logging.WARNING):
-            import asyncio
-            asyncio.run(client.list_tools())
+            await mcp_client.list_tools()
 
         # Should have logged the warning
         assert "Failed to list tools" in caplog.text or "Connection failed" in caplog.text
 
-    def test_mcp_close_exception_logged(self, caplog):
+    async def test_mcp_close_exception_logged(self, mcp_client, caplog):
         """Test that MCP close session exceptions are properly logged."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient(server_urls=["http://localhost:5001"])
-
         # Create a mock session that raises on close
         mock_session = MagicMock()
         mock_session.close = MagicMock(side_effect=Exception("Close failed"))
-        client._sessions["http://localhost:5001"] = mock_session
+        mcp_client._sessions["http://localhost:5001"] = mock_session
 
         with caplog.at_level(logging.WARNING):
-            import asyncio
-            asyncio.run(client.close())
+            await mcp_client.close()
 
         # Should have logged the warning
         assert "Error closing MCP session" in caplog.text or "Close failed" in caplog.text
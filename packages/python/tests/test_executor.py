@@ -4,7 +4,7 @@ Tests for the LiteAgentExecutor.
 import pytest
 import json
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 from a2a_lite.executor import LiteAgentExecutor
 from a2a_lite.decorators import SkillDefinition
@@ -58,27 +58,46 @@ class TestParseMessage:
         assert skill is None
         assert params == {"message": '{"action": "greet"}'}
 
+    def test_json_with_leading_whitespace(self):
+        executor = LiteAgentExecutor(skills={})
+        skill, params = executor._parse_message('  \n{"skill": "greet"}')
+        assert skill == "greet"
+        assert params == {}
+
+    def test_invalid_json_without_skill_is_not_parsed(self):
+        executor = LiteAgentExecutor(skills={})
+        with patch("a2a_lite.executor._json_loads", side_effect=AssertionError("parsed")):
+            skill, params = executor._parse_message('{"action": "greet"')
+        assert skill is None
+        assert params == {"message": '{"action": "greet"'}
+
+    def test_json_array_is_plain_text(self):
+        executor = LiteAgentExecutor(skills={})
+        skill, params = executor._parse_message('[1, 2]')
+        assert skill is None
+        assert params == {"message": "[1, 2]"}
+
 
 class TestExecuteSkill:
     @pytest.mark.asyncio
-    async def test_no_skills_registered(self):
+    async def test_no_skills_registered(self, event_queue):
         executor = LiteAgentExecutor(skills={})
-        result = await executor._execute_skill(None, {}, MagicMock(), {})
+        result = await executor._execute_skill(None, {}, event_queue, {})
         assert "error" in result
         assert "No skills registered" in result["error"]
 
     @pytest.mark.asyncio
-    async def test_auto_select_single_skill(self):
+    async def test_auto_select_single_skill(self, event_queue):
         async def greet(name: str = "World") -> str:
             return f"Hello, {name}!"
 
         skill = _make_skill("greet", greet)
         executor = LiteAgentExecutor(skills={"greet": skill})
-        result = await executor._execute_skill(None, {"name": "Test"}, MagicMock(), {})
+        result = await executor._execute_skill(None, {"name": "Test"}, event_queue, {})
         assert result == "Hello, Test!"
 
     @pytest.mark.asyncio
-    async def test_multiple_skills_no_name(self):
+    async def test_multiple_skills_no_name(self, event_queue):
         async def s1() -> str:
             return "one"
 
@@ -89,41 +108,54 @@ class TestExecuteSkill:
             "s1": _make_skill("s1", s1),
             "s2": _make_skill("s2", s2),
         })
-        result = await executor._execute_skill(None, {}, MagicMock(), {})
+        result = await executor._execute_skill(None, {}, event_queue, {})
         assert "error" in result
         assert "available_skills" in result
 
     @pytest.mark.asyncio
-    async def test_unknown_skill_name(self):
+    async def test_unknown_skill_name(self, event_queue):
         async def greet() -> str:
             return "hi"
 
         executor = LiteAgentExecutor(skills={"greet": _make_skill("greet", greet)})
-        result = await executor._execute_skill("unknown", {}, MagicMock(), {})
+        result = await executor._execute_skill("unknown", {}, event_queue, {})
         assert "error" in result
         assert "Unknown skill" in result["error"]
         assert "greet" in result["available_skills"]
 
     @pytest.mark.asyncio
-    async def test_sync_handler(self):
+    async def test_sync_handler(self, event_queue):
         def add(a: int, b: int) -> int:
             return a + b
 
         skill = _make_skill("add", add)
         executor = LiteAgentExecutor(skills={"add": skill})
-        result = await executor._execute_skill("add", {"a": 3, "b": 4}, MagicMock(), {})
+        result = await executor._execute_skill("add", {"a": 3, "b": 4}, event_queue, {})
         assert result == 7
 
     @pytest.mark.asyncio
-    async def test_async_handler(self):
+    async def test_async_handler(self, event_queue):
         async def add(a: int, b: int) -> int:
             return a + b
 
         skill = _make_skill("add", add)
         executor = LiteAgentExecutor(skills={"add": skill})
-        result = await executor._execute_skill("add", {"a": 5, "b": 6}, MagicMock(), {})
+        result = await executor._execute_skill("add", {"a": 5, "b": 6}, event_queue, {})
         assert result == 11
 
+    @pytest.mark.asyncio
+    async def test_generator_without_streaming_flag(self, event_queue):
+        async def count(n: int):
+            for i in range(n):
+                yield i
+
+        skill = _make_skill("count", count)
+        assert not skill.is_streaming
+        executor = LiteAgentExecutor(skills={"count": skill})
+        result = await executor._execute_skill("count", {"n": 3}, event_queue, {})
+        assert result is None
+        assert len(event_queue.events) == 3
+
 
 class TestConvertParams:
     def test_basic_params_unchanged(self):
@@ -246,63 +278,73 @@ class TestConvertParams:
         )
         assert "auth" not in result
 
+    def test_type_hints_resolved_once(self):
+        async def func(x: int) -> int:
+            return x
 
-class TestHandleError:
-    @pytest.mark.asyncio
-    async def test_error_without_handler(self):
-        events = []
+        skill = _make_skill("test", func)
+        executor = LiteAgentExecutor(skills={"test": skill})
+        executor._convert_params(skill, {"x": 1}, {})
+        assert skill.type_hints == {"x": int, "return": int}
 
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
+        with patch("typing.get_type_hints", side_effect=AssertionError("re-resolved")):
+            result = executor._convert_params(skill, {"x": 2}, {})
+        assert result == {"x": 2}
 
-        executor = LiteAgentExecutor(skills={})
-        await executor._handle_error(ValueError("test error"), MockEventQueue())
-        assert len(events) == 1
+    def test_conversion_plan_built_once(self):
+        from a2a_lite.parts import FilePart
 
-    @pytest.mark.asyncio
-    async def test_error_with_handler(self):
-        events = []
+        async def func(doc: FilePart, count: int) -> str:
+            return doc.name
+
+        skill = _make_skill("test", func)
+        executor = LiteAgentExecutor(skills={"test": skill})
+        executor._convert_params(skill, {"count": 1}, {})
+        plan = skill.conversion_plan
+        assert plan is not None
+        assert "count" not in plan
 
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
+        with patch.object(executor, "_build_conversion_plan", side_effect=AssertionError("rebuilt")):
+            result = executor._convert_params(
+                skill, {"doc": {"name": "a.txt", "data": "hi"}, "count": 2}, {}
+            )
+        assert isinstance(result["doc"], FilePart)
+        assert result["doc"].data == b"hi"
+        assert result["count"] == 2
+
+
+class TestHandleError:
+    @pytest.mark.asyncio
+    async def test_error_without_handler(self, event_queue):
+        executor = LiteAgentExecutor(skills={})
+        await executor._handle_error(ValueError("test error"), event_queue)
+        assert len(event_queue.events) == 1
 
+    @pytest.mark.asyncio
+    async def test_error_with_handler(self, event_queue):
         async def error_handler(error):
             return {"handled": True, "error": str(error)}
 
         executor = LiteAgentExecutor(skills={}, error_handler=error_handler)
-        await executor._handle_error(ValueError("test error"), MockEventQueue())
-        assert len(events) == 1
+        await executor._handle_error(ValueError("test error"), event_queue)
+        assert len(event_queue.events) == 1
 
     @pytest.mark.asyncio
-    async def test_error_handler_itself_fails(self):
-        events = []
-
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
-
+    async def test_error_handler_itself_fails(self, event_queue):
         async def bad_handler(error):
             raise RuntimeError("handler failed too")
 
         executor = LiteAgentExecutor(skills={}, error_handler=bad_handler)
-        await executor._handle_error(ValueError("original error"), MockEventQueue())
-        assert len(events) == 1
+        await executor._handle_error(ValueError("original error"), event_queue)
+        assert len(event_queue.events) == 1
 
 
 class TestCancel:
     @pytest.mark.asyncio
-    async def test_cancel(self):
-        events = []
-
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
-
+    async def test_cancel(self, event_queue):
         executor = LiteAgentExecutor(skills={})
-        await executor.cancel(MagicMock(), MockEventQueue())
-        assert len(events) == 1
+        await executor.cancel(None, event_queue)
+        assert len(event_queue.events) == 1
 
 
 class TestCallHandler:
@@ -323,3 +365,12 @@ class TestCallHandler:
         executor = LiteAgentExecutor(skills={})
         result = await executor._call_handler(handler, 5)
         assert result == 15
+
+    @pytest.mark.asyncio
+    async def test_sync_handler_with_kwargs(self):
+        def handler(x, y=1):
+            return x * y
+
+        executor = LiteAgentExecutor(skills={})
+        result = await executor._call_handler(handler, 5, y=4)
+        assert result == 20
@@ -1,14 +1,54 @@
 """
 Integration tests using httpx to test running agents.
 """
-import pytest
+import itertools
 import json
-from uuid import uuid4
+
+import httpx
+import pytest
 
 from a2a_lite import Agent
 
+# Request and message ids only need to be unique, so a counter avoids uuid4()
+_ids = itertools.count()
+
+
+def _next_id() -> str:
+    return f"t{next(_ids)}"
+
+
+def _make_request(text: str) -> dict:
+    """Build a message/send JSON-RPC request carrying one text part."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "message/send",
+        "id": _next_id(),
+        "params": {
+            "message": {
+                "role": "user",
+                "parts": [{"type": "text", "text": text}],
+                "messageId": _next_id(),
+            }
+        },
+    }
+
+
+async def _request(app, method: str, url: str, **kwargs) -> httpx.Response:
+    """Call the ASGI app in-process on the test's own event loop.
+
+    ``httpx.ASGITransport`` avoids the thread and blocking portal that
+    starlette's ``TestClient`` starts for every client.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        return await client.request(method, url, **kwargs)
 
-@pytest.fixture
+
+async def _post(app, body: dict) -> httpx.Response:
+    return await _request(app, "POST", "/", json=body)
+
+
+@pytest.fixture(scope="module")
 def calculator_agent():
     """Create a calculator agent for testing."""
     agent = Agent(name="Calculator", description="Math operations")
@@ -24,7 +64,7 @@ def calculator_agent():
     return agent
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def greeting_agent():
     """Create a greeting agent for testing."""
     agent = Agent(name="Greeter", description="Greeting service")
@@ -36,6 +76,18 @@ def greeting_agent():
     return agent
 
 
+@pytest.fixture(scope="module")
+def calculator_app(calculator_agent):
+    """The calculator agent's ASGI app, shared across the module."""
+    return calculator_agent.get_app()
+
+
+@pytest.fixture(scope="module")
+def greeting_app(greeting_agent):
+    """The greeting agent's ASGI app, shared across the module."""
+    return greeting_agent.get_app()
+
+
 def test_agent_card_generation(calculator_agent):
     """Test that agent card is generated correctly."""
     card = calculator_agent.build_agent_card("localhost", 8787)
@@ -58,14 +110,9 @@ def test_get_app(calculator_agent):
 
 
 @pytest.mark.asyncio
-async def test_agent_card_endpoint(calculator_agent):
+async def test_agent_card_endpoint(calculator_app):
     """Test that agent card is served correctly."""
-    from starlette.testclient import TestClient
-
-    app = calculator_agent.get_app()
-    client = TestClient(app)
-
-    response = client.get("/.well-known/agent.json")
+    response = await _request(calculator_app, "GET", "/.well-known/agent.json")
 
     assert response.status_code == 200
     data = response.json()
@@ -74,29 +121,13 @@ async def test_agent_card_endpoint(calculator_agent):
 
 
 @pytest.mark.asyncio
-async def test_skill_invocation(calculator_agent):
+async def test_skill_invocation(calculator_app):
     """Test invoking a skill via HTTP."""
-    from starlette.testclient import TestClient
-
-    app = calculator_agent.get_app()
-    client = TestClient(app)
-
     # Build A2A request
     message = json.dumps({"skill": "add", "params": {"a": 5, "b": 3}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(calculator_app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -105,82 +136,34 @@ async def test_skill_invocation(calculator_agent):
 
 
 @pytest.mark.asyncio
-async def test_unknown_skill(calculator_agent):
+async def test_unknown_skill(calculator_app):
     """Test calling an unknown skill."""
-    from starlette.testclient import TestClient
-
-    app = calculator_agent.get_app()
-    client = TestClient(app)
-
     message = json.dumps({"skill": "unknown_skill", "params": {}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(calculator_app, request_body)
     assert response.status_code == 200
     # Should still return 200 but with error in result
 
 
 @pytest.mark.asyncio
-async def test_greeting_skill(greeting_agent):
+async def test_greeting_skill(greeting_app):
     """Test greeting agent."""
-    from starlette.testclient import TestClient
-
-    app = greeting_agent.get_app()
-    client = TestClient(app)
-
     message = json.dumps({"skill": "greet", "params": {"name": "Alice"}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(greeting_app, request_body)
     assert response.status_code == 200
 
 
 @pytest.mark.asyncio
-async def test_default_parameter(greeting_agent):
+async def test_default_parameter(greeting_app):
     """Test skill with default parameter."""
-    from starlette.testclient import TestClient
-
-    app = greeting_agent.get_app()
-    client = TestClient(app)
-
     # Call without 'name' parameter - should use default
     message = json.dumps({"skill": "greet", "params": {}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(greeting_app, request_body)
     assert response.status_code == 200
 
 
@@ -218,9 +201,8 @@ def test_multiple_agents():
     assert "skill1" not in agent2._skills
 
 
-def test_sync_skill_via_http():
+async def test_sync_skill_via_http():
     """Test that sync skills work via HTTP."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="SyncTest", description="Sync skill test")
 
@@ -229,23 +211,11 @@ def test_sync_skill_via_http():
         return x * 2
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "double", "params": {"x": 21}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -253,9 +223,8 @@ def test_sync_skill_via_http():
     assert "42" in result_text
 
 
-def test_skill_returning_dict_via_http():
+async def test_skill_returning_dict_via_http():
     """Test skill returning dict via HTTP."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="DictTest", description="Dict result test")
 
@@ -264,23 +233,11 @@ def test_skill_returning_dict_via_http():
         return {"name": name, "status": "active"}
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "info", "params": {"name": "Alice"}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -290,9 +247,8 @@ def test_skill_returning_dict_via_http():
     assert result["status"] == "active"
 
 
-def test_skill_returning_list_via_http():
+async def test_skill_returning_list_via_http():
     """Test skill returning list via HTTP."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="ListTest", description="List result test")
 
@@ -301,23 +257,11 @@ def test_skill_returning_list_via_http():
         return list(range(n))
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "numbers", "params": {"n": 5}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -326,9 +270,8 @@ def test_skill_returning_list_via_http():
     assert result == [0, 1, 2, 3, 4]
 
 
-def test_error_handler_via_http():
+async def test_error_handler_via_http():
     """Test that custom error handler is called via HTTP."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="ErrorTest", description="Error handler test")
 
@@ -341,23 +284,11 @@ def test_error_handler_via_http():
         return {"handled": True, "error_type": type(error).__name__}
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "fail", "params": {}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -366,9 +297,8 @@ def test_error_handler_via_http():
     assert result["handled"] is True
 
 
-def test_middleware_via_http():
+async def test_middleware_via_http():
     """Test middleware execution via HTTP."""
-    from starlette.testclient import TestClient
     from a2a_lite.middleware import timing_middleware
 
     agent = Agent(name="MWTest", description="Middleware test")
@@ -379,23 +309,11 @@ def test_middleware_via_http():
         return f"Hello, {name}!"
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "hello", "params": {"name": "Test"}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -403,9 +321,8 @@ def test_middleware_via_http():
     assert "Hello, Test!" in result_text
 
 
-def test_plain_text_message():
+async def test_plain_text_message():
     """Test sending a plain text (non-JSON) message to an agent."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="PlainTest", description="Plain text test")
 
@@ -414,29 +331,16 @@ def test_plain_text_message():
         return f"Echo: {message}"
 
     app = agent.get_app()
-    client = TestClient(app)
 
     # Send plain text instead of JSON skill call
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": "Hello there"}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request("Hello there")
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
 
-def test_pydantic_model_via_http():
+async def test_pydantic_model_via_http():
     """Test Pydantic model parameter via HTTP."""
-    from starlette.testclient import TestClient
     from pydantic import BaseModel
 
     class UserInput(BaseModel):
@@ -450,26 +354,14 @@ def test_pydantic_model_via_http():
         return {"created": True, "name": user.name, "age": user.age}
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({
         "skill": "create_user",
         "params": {"user": {"name": "Alice", "age": 30}},
     })
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
@@ -479,35 +371,21 @@ def test_pydantic_model_via_http():
     assert result["name"] == "Alice"
 
 
-def test_agent_with_no_skills():
+async def test_agent_with_no_skills():
     """Test agent with no skills registered."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="EmptyAgent", description="No skills")
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "nonexistent", "params": {}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
 
-def test_completion_hook_via_http():
+async def test_completion_hook_via_http():
     """Test that completion hooks are called."""
-    from starlette.testclient import TestClient
 
     completed_skills = []
     agent = Agent(name="HookTest", description="Hook test")
@@ -521,30 +399,17 @@ def test_completion_hook_via_http():
         completed_skills.append(skill_name)
 
     app = agent.get_app()
-    client = TestClient(app)
 
     message = json.dumps({"skill": "hello", "params": {}})
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": message}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request(message)
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
     assert "hello" in completed_skills
 
 
-def test_single_skill_auto_dispatch():
+async def test_single_skill_auto_dispatch():
     """Test that a single-skill agent auto-dispatches plain text."""
-    from starlette.testclient import TestClient
 
     agent = Agent(name="SingleSkill", description="One skill")
 
@@ -553,23 +418,11 @@ def test_single_skill_auto_dispatch():
         return f"Echo: {message}"
 
     app = agent.get_app()
-    client = TestClient(app)
 
     # Send plain text — should auto-dispatch to the only skill
-    request_body = {
-        "jsonrpc": "2.0",
-        "method": "message/send",
-        "id": uuid4().hex,
-        "params": {
-            "message": {
-                "role": "user",
-                "parts": [{"type": "text", "text": "Hello there"}],
-                "messageId": uuid4().hex,
-            }
-        }
-    }
+    request_body = _make_request("Hello there")
 
-    response = client.post("/", json=request_body)
+    response = await _post(app, request_body)
     assert response.status_code == 200
 
     data = response.json()
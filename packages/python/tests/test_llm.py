@@ -130,13 +130,16 @@ class TestOllamaSkill:
         mock_response.raise_for_status = MagicMock()
 
         mock_client = AsyncMock()
+        mock_client.is_closed = False
         mock_client.post.return_value = mock_response
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
+        with patch("httpx.AsyncClient", return_value=mock_client) as client_cls:
             result = await local(message="hello")
             assert result == "Ollama says hi"
+            # The pooled client is reused for later calls on the same loop
+            assert await local(message="again") == "Ollama says hi"
+            assert client_cls.call_count == 1
+            assert mock_client.post.await_count == 2
 
 
 class TestDecoratorPreservesMetadata:
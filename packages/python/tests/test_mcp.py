@@ -1,11 +1,34 @@
 """
 Tests for the MCP integration module.
 """
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
 
-from a2a_lite.mcp import MCPClient, _extract_mcp_content
 from a2a_lite import Agent
+from a2a_lite.mcp import MCPClient, _extract_mcp_content
+
+
+class _FakeSession:
+    """Plain-coroutine stand-in for an MCP ClientSession that records calls."""
+
+    def __init__(self, result=None, tools=()):
+        self._result = result
+        self._tools = SimpleNamespace(tools=list(tools))
+        self.calls = []
+        self.list_calls = 0
+
+    async def initialize(self):
+        pass
+
+    async def call_tool(self, name, arguments):
+        self.calls.append((name, arguments))
+        return self._result
+
+    async def list_tools(self):
+        self.list_calls += 1
+        return self._tools
 
 
 class TestMCPClient:
@@ -50,40 +73,71 @@ class TestMCPClient:
         await client.close()  # Should not raise
 
     @pytest.mark.asyncio
-    async def test_call_tool_with_mock_session(self):
+    async def test_close_runs_sessions_concurrently(self):
+        import asyncio
+
+        client = MCPClient(
+            server_urls=["http://localhost:5001", "http://localhost:5002"]
+        )
+        started = []
+        closed = []
+        both_started = asyncio.Event()
+
+        class SlowSession:
+            async def close(self):
+                started.append(self)
+                if len(started) == 2:
+                    both_started.set()
+                # Times out if the closes run one after the other
+                await asyncio.wait_for(both_started.wait(), timeout=1)
+                closed.append(self)
+
+        client._sessions["http://localhost:5001"] = SlowSession()
+        client._sessions["http://localhost:5002"] = SlowSession()
+
+        await client.close()
+        assert len(closed) == 2
+        assert client._sessions == {}
+
+    @pytest.mark.asyncio
+    async def test_close_holds_and_keeps_session_lock(self):
         client = MCPClient(server_urls=["http://localhost:5001"])
+        lock = client._session_locks["http://localhost:5001"]
+        held = []
 
-        # Mock the session
-        mock_session = AsyncMock()
-        mock_result = MagicMock()
-        mock_content = MagicMock()
-        mock_content.text = "search result"
-        mock_result.content = [mock_content]
-        mock_session.call_tool.return_value = mock_result
-        mock_session.initialize = AsyncMock()
+        class Session:
+            async def close(self):
+                held.append(lock.locked())
+
+        client._sessions["http://localhost:5001"] = Session()
 
-        client._sessions["http://localhost:5001"] = mock_session
+        await client.close()
+        assert held == [True]
+        assert client._session_locks["http://localhost:5001"] is lock
+
+    @pytest.mark.asyncio
+    async def test_call_tool_with_mock_session(self):
+        client = MCPClient(server_urls=["http://localhost:5001"])
+
+        session = _FakeSession(
+            result=SimpleNamespace(content=[SimpleNamespace(text="search result")])
+        )
+        client._sessions["http://localhost:5001"] = session
 
         result = await client.call_tool("web_search", query="test")
         assert result == "search result"
-        mock_session.call_tool.assert_called_once_with(
-            "web_search", arguments={"query": "test"}
-        )
+        assert session.calls == [("web_search", {"query": "test"})]
 
     @pytest.mark.asyncio
     async def test_list_tools_with_mock_session(self):
         client = MCPClient(server_urls=["http://localhost:5001"])
 
-        mock_session = AsyncMock()
-        mock_tool = MagicMock()
-        mock_tool.name = "web_search"
-        mock_tool.description = "Search the web"
-        mock_tool.inputSchema = {"type": "object"}
-        mock_response = MagicMock()
-        mock_response.tools = [mock_tool]
-        mock_session.list_tools.return_value = mock_response
-
-        client._sessions["http://localhost:5001"] = mock_session
+        tool = SimpleNamespace(
+            name="web_search",
+            description="Search the web",
+            inputSchema={"type": "object"},
+        )
+        client._sessions["http://localhost:5001"] = _FakeSession(tools=[tool])
 
         tools = await client.list_tools()
         assert len(tools) == 1
@@ -91,6 +145,88 @@ class TestMCPClient:
         assert tools[0]["description"] == "Search the web"
         assert tools[0]["server_url"] == "http://localhost:5001"
 
+    @pytest.mark.asyncio
+    async def test_list_tools_is_cached_until_invalidated(self):
+        client = MCPClient(server_urls=["http://localhost:5001"])
+
+        session = _FakeSession(tools=[SimpleNamespace(name="web_search")])
+        client._sessions["http://localhost:5001"] = session
+
+        await client.list_tools()
+        tools = await client.list_tools()
+        assert tools[0]["name"] == "web_search"
+        assert session.list_calls == 1
+
+        client.invalidate_tools("http://localhost:5001")
+        await client.list_tools()
+        assert session.list_calls == 2
+
+    @pytest.mark.asyncio
+    async def test_list_tools_returns_copies_of_cache(self):
+        client = MCPClient(server_urls=["http://localhost:5001"])
+        client._sessions["http://localhost:5001"] = _FakeSession(
+            tools=[SimpleNamespace(name="web_search", inputSchema={"type": "object"})]
+        )
+
+        first = await client.list_tools()
+        first[0]["name"] = "mutated"
+        first[0]["input_schema"]["type"] = "mutated"
+
+        second = await client.list_tools()
+        assert second[0]["name"] == "web_search"
+        assert second[0]["input_schema"] == {"type": "object"}
+
+    @pytest.mark.asyncio
+    async def test_list_tools_skips_failing_server(self):
+        client = MCPClient(
+            server_urls=["http://localhost:5001", "http://localhost:5002"]
+        )
+
+        async def get_session(url):
+            if url == "http://localhost:5001":
+                raise ConnectionError("unreachable")
+            return _FakeSession(tools=[SimpleNamespace(name="web_search")])
+
+        client._get_session = get_session
+
+        tools = await client.list_tools()
+        assert [t["server_url"] for t in tools] == ["http://localhost:5002"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_get_session_opens_once(self):
+        import asyncio
+        import sys
+        import types
+
+        opened = []
+
+        class FakeSession:
+            def __init__(self, read_stream, write_stream):
+                opened.append(self)
+
+            async def initialize(self):
+                await asyncio.sleep(0)
+
+        mcp_mod = types.ModuleType("mcp")
+        mcp_mod.ClientSession = FakeSession
+        sse_mod = types.ModuleType("mcp.client.sse")
+        sse_mod.sse_client = lambda url: (None, None)
+        fake_modules = {
+            "mcp": mcp_mod,
+            "mcp.client": types.ModuleType("mcp.client"),
+            "mcp.client.sse": sse_mod,
+        }
+
+        client = MCPClient(server_urls=["http://localhost:5001"])
+        with patch.dict(sys.modules, fake_modules):
+            s1, s2 = await asyncio.gather(
+                client._get_session("http://localhost:5001"),
+                client._get_session("http://localhost:5001"),
+            )
+
+        assert s1 is s2
+        assert len(opened) == 1
+
 
 class TestExtractMCPContent:
     def test_single_text_content(self):
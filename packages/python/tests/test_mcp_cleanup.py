@@ -4,16 +4,23 @@ Tests for MCP Client resource cleanup (memory leak fix).
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 
+from a2a_lite import Agent
+from a2a_lite.testing import AsyncAgentTestClient
+
+
+@pytest.fixture(scope="module")
+def agent():
+    """A skill-less agent shared by the test-client tests; none of them mutate it."""
+    return Agent(name="Test", description="Test")
+
 
 class TestMCPClientCleanup:
     """Tests that MCPClient properly cleans up resources."""
 
     @pytest.mark.asyncio
-    async def test_mcp_client_context_manager(self):
+    async def test_mcp_client_context_manager(self, mcp_client):
         """Test that MCPClient works as an async context manager."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient(server_urls=["http://localhost:5001"])
+        client = mcp_client
 
         # Mock close to verify it's called
         client.close = AsyncMock()
@@ -25,11 +32,9 @@ class TestMCPClientCleanup:
         client.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_mcp_client_context_manager_exception(self):
+    async def test_mcp_client_context_manager_exception(self, mcp_client):
         """Test that MCPClient closes even on exception."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient(server_urls=["http://localhost:5001"])
+        client = mcp_client
 
         # Mock close to verify it's called
         client.close = AsyncMock()
@@ -53,11 +58,9 @@ class TestMCPClientCleanup:
         assert callable(client.__aexit__)
 
     @pytest.mark.asyncio
-    async def test_mcp_client_close_clears_sessions(self):
+    async def test_mcp_client_close_clears_sessions(self, mcp_client):
         """Test that close() clears all sessions."""
-        from a2a_lite.mcp import MCPClient
-
-        client = MCPClient(server_urls=["http://localhost:5001"])
+        client = mcp_client
 
         # Add a mock session
         mock_session = MagicMock()
@@ -71,12 +74,8 @@ class TestMCPClientCleanup:
         mock_session.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_async_agent_test_client_has_aenter_aexit(self):
+    async def test_async_agent_test_client_has_aenter_aexit(self, agent):
         """Test that AsyncAgentTestClient has context manager support."""
-        from a2a_lite.testing import AsyncAgentTestClient
-        from a2a_lite import Agent
-
-        agent = Agent(name="Test", description="Test")
         client = AsyncAgentTestClient(agent)
 
         # Check for context manager methods
@@ -86,12 +85,8 @@ class TestMCPClientCleanup:
         assert callable(client.__aexit__)
 
     @pytest.mark.asyncio
-    async def test_async_agent_test_client_context_manager(self):
+    async def test_async_agent_test_client_context_manager(self, agent):
         """Test AsyncAgentTestClient as context manager closes client."""
-        from a2a_lite.testing import AsyncAgentTestClient
-        from a2a_lite import Agent
-
-        agent = Agent(name="Test", description="Test")
         client = AsyncAgentTestClient(agent)
 
         # Mock close method
@@ -104,12 +99,8 @@ class TestMCPClientCleanup:
         client.close.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_async_agent_test_client_context_manager_exception(self):
+    async def test_async_agent_test_client_context_manager_exception(self, agent):
         """Test AsyncAgentTestClient closes on exception."""
-        from a2a_lite.testing import AsyncAgentTestClient
-        from a2a_lite import Agent
-
-        agent = Agent(name="Test", description="Test")
         client = AsyncAgentTestClient(agent)
 
         # Mock close method
@@ -1,15 +1,18 @@
 """
 Tests for middleware functionality.
 """
+from unittest.mock import patch
+
 import pytest
+
 from a2a_lite.middleware import (
-    MiddlewareContext,
     MiddlewareChain,
+    MiddlewareContext,
+    RateLimitExceeded,
     logging_middleware,
-    timing_middleware,
-    retry_middleware,
     rate_limit_middleware,
-    RateLimitExceeded,
+    retry_middleware,
+    timing_middleware,
 )
 
 
@@ -25,7 +28,25 @@ def test_middleware_context_creation():
     assert ctx.metadata == {}
 
 
-def test_middleware_chain():
+@pytest.mark.asyncio
+async def test_middleware_can_set_custom_context_attributes():
+    """Test that middleware may attach ad-hoc attributes to the context."""
+    chain = MiddlewareChain()
+
+    async def authenticate(ctx, next):
+        ctx.user_id = "user-1"
+        return await next()
+
+    chain.add(authenticate)
+
+    async def handler(ctx):
+        return ctx.user_id
+
+    assert await chain.execute(MiddlewareContext(), handler) == "user-1"
+
+
+@pytest.mark.asyncio
+async def test_middleware_chain():
     """Test middleware chain execution."""
     chain = MiddlewareChain()
     order = []
@@ -49,9 +70,8 @@ def test_middleware_chain():
         order.append("handler")
         return "result"
 
-    import asyncio
     ctx = MiddlewareContext(skill="test")
-    result = asyncio.run(chain.execute(ctx, final_handler))
+    result = await chain.execute(ctx, final_handler)
 
     assert result == "result"
     assert order == ["m1_before", "m2_before", "handler", "m2_after", "m1_after"]
@@ -124,6 +144,31 @@ async def test_rate_limit_middleware():
         await chain.execute(ctx3, handler)
 
 
+@pytest.mark.asyncio
+async def test_rate_limit_window_slides():
+    """Requests older than a minute stop counting against the limit."""
+    chain = MiddlewareChain()
+    chain.add(rate_limit_middleware(requests_per_minute=2))
+
+    async def handler(ctx):
+        return "ok"
+
+    with patch("time.monotonic", side_effect=[0.0, 30.0, 59.0, 61.0]):
+        await chain.execute(MiddlewareContext(), handler)
+        await chain.execute(MiddlewareContext(), handler)
+        with pytest.raises(RateLimitExceeded):
+            await chain.execute(MiddlewareContext(), handler)
+        # The request at t=0 has left the window
+        assert await chain.execute(MiddlewareContext(), handler) == "ok"
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_rate_limit_rejects_non_positive_limit(limit):
+    """A limit below one request per minute is rejected up front."""
+    with pytest.raises(ValueError, match="requests_per_minute must be at least 1"):
+        rate_limit_middleware(requests_per_minute=limit)
+
+
 @pytest.mark.asyncio
 async def test_empty_middleware_chain():
     """Test that an empty chain just calls the final handler."""
@@ -135,6 +180,7 @@ async def test_empty_middleware_chain():
     ctx = MiddlewareContext(skill="test")
     result = await chain.execute(ctx, handler)
     assert result == "direct"
+    assert chain._compiled is None
 
 
 @pytest.mark.asyncio
@@ -251,6 +297,36 @@ async def test_retry_middleware_all_retries_fail():
     assert len(attempts) == 3
 
 
+@pytest.mark.asyncio
+async def test_retry_middleware_backoff_and_retry_on():
+    """Backoff doubles up to max_delay; unlisted errors are not retried."""
+    chain = MiddlewareChain()
+    chain.add(
+        retry_middleware(max_retries=4, delay=1.0, max_delay=3.0, retry_on=(ValueError,))
+    )
+
+    async def always_fails(ctx):
+        raise ValueError("nope")
+
+    with (
+        patch("asyncio.sleep") as sleep,
+        patch("random.random", return_value=1.0),
+        pytest.raises(ValueError),
+    ):
+        await chain.execute(MiddlewareContext(), always_fails)
+    assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0, 3.0]
+
+    attempts = []
+
+    async def rate_limited(ctx):
+        attempts.append(1)
+        raise RateLimitExceeded("slow down")
+
+    with pytest.raises(RateLimitExceeded):
+        await chain.execute(MiddlewareContext(), rate_limited)
+    assert len(attempts) == 1
+
+
 @pytest.mark.asyncio
 async def test_middleware_context_defaults():
     """Test MiddlewareContext default values."""
@@ -279,3 +355,42 @@ async def test_multiple_middlewares_combined():
     assert result == "done"
     assert "execution_time_ms" in ctx.metadata
     assert ctx.metadata["execution_time_ms"] >= 50
+
+
+def test_compile_without_middleware_returns_handler():
+    """Test that an empty chain compiles to the final handler itself."""
+    chain = MiddlewareChain()
+
+    async def handler(ctx):
+        return "done"
+
+    assert chain.compile(handler) is handler
+
+
+@pytest.mark.asyncio
+async def test_compile_is_cached_until_chain_changes():
+    """Test that compile() reuses the composed chain and rebuilds after add()."""
+    chain = MiddlewareChain()
+    calls = []
+
+    async def first(ctx, next):
+        calls.append("first")
+        return await next()
+
+    async def second(ctx, next):
+        calls.append("second")
+        return await next()
+
+    async def handler(ctx):
+        return "done"
+
+    chain.add(first)
+    compiled = chain.compile(handler)
+    assert chain.compile(handler) is compiled
+
+    chain.add(second)
+    recompiled = chain.compile(handler)
+    assert recompiled is not compiled
+
+    assert await recompiled(MiddlewareContext(skill="test")) == "done"
+    assert calls == ["first", "second"]
@@ -1,12 +1,14 @@
 """
 Tests for the orchestration module (AgentNetwork, delegate).
 """
+import asyncio
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
 
-from a2a_lite.orchestration import AgentNetwork, _call_remote_skill, _extract_result
 from a2a_lite import Agent
+from a2a_lite.orchestration import AgentNetwork, _call_remote_skill, _extract_result
 
 
 class TestAgentNetwork:
@@ -105,6 +107,106 @@ class TestAgentNetwork:
             assert results["a"] == "ok"
             assert "error" in results["b"]
 
+    @pytest.mark.asyncio
+    async def test_broadcast_respects_max_concurrency(self):
+        net = AgentNetwork({f"a{i}": f"http://a{i}:8787" for i in range(5)})
+        in_flight = 0
+        peak = 0
+
+        async def fake_call(url, skill, params, timeout):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return url
+
+        with patch("a2a_lite.orchestration._call_remote_skill", side_effect=fake_call):
+            results = await net.broadcast("s", broadcast_concurrency=2)
+        assert results == {f"a{i}": f"http://a{i}:8787" for i in range(5)}
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_broadcast_is_unbounded_and_forwards_all_params(self):
+        net = AgentNetwork({f"a{i}": f"http://a{i}:8787" for i in range(12)})
+        in_flight = 0
+        peak = 0
+
+        async def fake_call(url, skill, params, timeout):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return params
+
+        with patch("a2a_lite.orchestration._call_remote_skill", side_effect=fake_call):
+            results = await net.broadcast("s", max_concurrency=3)
+        assert peak == 12
+        assert all(params == {"max_concurrency": 3} for params in results.values())
+
+    @pytest.mark.asyncio
+    async def test_call_many_preserves_order(self):
+        net = AgentNetwork()
+        net.add("a", "http://a:8787")
+        net.add("b", "http://b:8787")
+
+        async def fake_call(url, skill, params, timeout):
+            if url == "http://a:8787":
+                await asyncio.sleep(0.01)
+            return f"{url}/{skill}/{params['x']}"
+
+        with patch("a2a_lite.orchestration._call_remote_skill", side_effect=fake_call):
+            results = await net.call_many(
+                [("a", "one", {"x": 1}), ("b", "two", {"x": 2})],
+                max_concurrency=2,
+            )
+        assert results == ["http://a:8787/one/1", "http://b:8787/two/2"]
+
+    @pytest.mark.asyncio
+    async def test_call_many_respects_max_concurrency(self):
+        net = AgentNetwork()
+        net.add("a", "http://a:8787")
+        in_flight = 0
+        peak = 0
+
+        async def fake_call(url, skill, params, timeout):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "ok"
+
+        with patch("a2a_lite.orchestration._call_remote_skill", side_effect=fake_call):
+            results = await net.call_many([("a", "s", {})] * 5, max_concurrency=2)
+        assert results == ["ok"] * 5
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_call_many_errors_and_unknown_agent(self):
+        net = AgentNetwork()
+        net.add("a", "http://a:8787")
+
+        with patch("a2a_lite.orchestration._call_remote_skill", new_callable=AsyncMock) as mock:
+            mock.side_effect = [ValueError("bad")]
+            results = await net.call_many([("a", "s", {})])
+            assert results == [{"error": "bad", "type": "ValueError"}]
+
+            with pytest.raises(KeyError, match="missing"):
+                await net.call_many([("a", "s", {}), ("missing", "s", {})])
+            assert mock.await_count == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [0, -1])
+    async def test_call_many_rejects_max_concurrency_below_one(self, limit):
+        net = AgentNetwork({"a": "http://a:8787"})
+
+        with patch("a2a_lite.orchestration._call_remote_skill", new_callable=AsyncMock) as mock:
+            with pytest.raises(ValueError, match="at least 1"):
+                await net.call_many([("a", "s", {})], max_concurrency=limit)
+            mock.assert_not_awaited()
+
 
 class TestExtractResult:
     def test_extract_text_part(self):
@@ -131,6 +233,26 @@ class TestExtractResult:
         }
         assert _extract_result(response) == "just text"
 
+    def test_extract_plain_text_skips_json_parse(self):
+        response = {"result": {"parts": [{"kind": "text", "text": "Hello there"}]}}
+        with patch("a2a_lite.orchestration._json_loads") as loads:
+            assert _extract_result(response) == "Hello there"
+        loads.assert_not_called()
+
+    def test_extract_json_scalars(self):
+        for text, expected in [(" 42", 42), ("-1.5", -1.5), ("true", True), ("null", None)]:
+            response = {"result": {"parts": [{"kind": "text", "text": text}]}}
+            assert _extract_result(response) == expected
+
+    def test_extract_non_finite_floats(self):
+        for text in ("NaN", "Infinity", "-Infinity"):
+            response = {"result": {"parts": [{"kind": "text", "text": text}]}}
+            result = _extract_result(response)
+            assert isinstance(result, float)
+            assert repr(result) == repr(json.loads(text))
+        response = {"result": {"parts": [{"kind": "text", "text": "Nice day"}]}}
+        assert _extract_result(response) == "Nice day"
+
     def test_extract_error(self):
         response = {"error": {"code": -32000, "message": "fail"}}
         result = _extract_result(response)
@@ -149,6 +271,43 @@ class TestExtractResult:
         assert _extract_result(response) == "hello"
 
 
+class TestCallRemoteSkill:
+    @pytest.mark.asyncio
+    async def test_reuses_pooled_client(self):
+        mock_response = MagicMock()
+        mock_response.content = (
+            b'{"result": {"parts": [{"kind": "text", "text": "{\\"ok\\": true}"}]}}'
+        )
+
+        mock_client = AsyncMock()
+        mock_client.is_closed = False
+        mock_client.post.return_value = mock_response
+
+        with patch("httpx.AsyncClient", return_value=mock_client) as client_cls:
+            assert await _call_remote_skill("http://a:8787", "s", {}) == {"ok": True}
+            assert await _call_remote_skill("http://b:8787", "s", {}, 5.0) == {"ok": True}
+            assert client_cls.call_count == 1
+            assert mock_client.post.await_args.kwargs["timeout"] == 5.0
+
+    @pytest.mark.asyncio
+    async def test_network_close_closes_pooled_client(self):
+        mock_response = MagicMock()
+        mock_response.content = b'{"result": {"parts": [{"kind": "text", "text": "1"}]}}'
+
+        first, second = AsyncMock(), AsyncMock()
+        for client in (first, second):
+            client.is_closed = False
+            client.post.return_value = mock_response
+
+        with patch("httpx.AsyncClient", side_effect=[first, second]):
+            await _call_remote_skill("http://a:8787", "s", {})
+            await AgentNetwork().close()
+            first.aclose.assert_awaited_once()
+
+            await _call_remote_skill("http://a:8787", "s", {})
+            second.post.assert_awaited_once()
+
+
 class TestAgentDelegate:
     @pytest.mark.asyncio
     async def test_delegate_with_url(self):
@@ -1,9 +1,61 @@
 """
 Tests for multi-modal parts (FilePart, DataPart, Artifact).
 """
-import pytest
 import base64
-from a2a_lite.parts import TextPart, FilePart, DataPart, Artifact, parse_part
+import dataclasses
+
+import pytest
+
+from a2a_lite.parts import Artifact, DataPart, FilePart, TextPart, parse_part
+
+# Expected base64 payloads, encoded once at import
+_HELLO_B64 = base64.b64encode(b"Hello").decode()
+_BYE_B64 = base64.b64encode(b"Bye").decode()
+_DATA_B64 = base64.b64encode(b"data").decode()
+_EMPTY_B64 = base64.b64encode(b"").decode()
+
+
+class TestPartRoundTrip:
+    @pytest.mark.parametrize(
+        "cls, kwargs, expected",
+        [
+            (TextPart, {"text": "Hello"}, {"type": "text", "text": "Hello"}),
+            (
+                DataPart,
+                {"data": {"key": "value"}},
+                {"type": "data", "data": {"key": "value"}},
+            ),
+            (
+                FilePart,
+                {"name": "test.txt", "mime_type": "text/plain", "data": b"Hello"},
+                {
+                    "type": "file",
+                    "file": {"name": "test.txt", "mimeType": "text/plain", "bytes": _HELLO_B64},
+                },
+            ),
+            (
+                FilePart,
+                {
+                    "name": "remote.txt",
+                    "mime_type": "text/plain",
+                    "uri": "https://example.com/file.txt",
+                },
+                {
+                    "type": "file",
+                    "file": {
+                        "name": "remote.txt",
+                        "mimeType": "text/plain",
+                        "uri": "https://example.com/file.txt",
+                    },
+                },
+            ),
+        ],
+        ids=["text", "data", "file_bytes", "file_uri"],
+    )
+    def test_roundtrip(self, cls, kwargs, expected):
+        part = cls(**kwargs)
+        assert part.to_a2a() == expected
+        assert cls.from_a2a(expected) == part
 
 
 class TestTextPart:
@@ -11,16 +63,19 @@ class TestTextPart:
         part = TextPart(text="Hello, world!")
         assert part.text == "Hello, world!"
 
-    def test_to_a2a(self):
-        part = TextPart(text="Hello")
-        assert part.to_a2a() == {"type": "text", "text": "Hello"}
 
-    def test_from_a2a(self):
-        part = TextPart.from_a2a({"type": "text", "text": "Hello"})
-        assert part.text == "Hello"
+class TestFilePart:
+    def test_uses_slots(self):
+        part = FilePart(name="test.txt")
+        assert not hasattr(part, "__dict__")
 
+    def test_encoding_cache_is_not_a_field(self):
+        part = FilePart(name="test.txt", data=b"hello")
+        part.to_a2a()
+        assert [f.name for f in dataclasses.fields(part)] == ["name", "mime_type", "data", "uri"]
+        assert "_encoded" not in repr(part)
+        assert part == FilePart(name="test.txt", data=b"hello")
 
-class TestFilePart:
     def test_creation_with_bytes(self):
         part = FilePart(
             name="test.txt",
@@ -40,49 +95,21 @@ class TestFilePart:
         assert part.is_uri
         assert not part.is_bytes
 
-    def test_to_a2a_bytes(self):
-        data = b"Hello"
-        part = FilePart(name="test.txt", data=data)
-        result = part.to_a2a()
-
-        assert result["type"] == "file"
-        assert result["file"]["name"] == "test.txt"
-        assert result["file"]["bytes"] == base64.b64encode(data).decode()
-
-    def test_to_a2a_uri(self):
-        part = FilePart(name="test.txt", uri="https://example.com/file.txt")
-        result = part.to_a2a()
-
-        assert result["type"] == "file"
-        assert result["file"]["uri"] == "https://example.com/file.txt"
-
-    def test_from_a2a_bytes(self):
-        data = b"Hello"
-        a2a_data = {
-            "type": "file",
-            "file": {
-                "name": "test.txt",
-                "mimeType": "text/plain",
-                "bytes": base64.b64encode(data).decode(),
-            }
-        }
-        part = FilePart.from_a2a(a2a_data)
+    def test_to_a2a_bytes_follows_data_changes(self):
+        part = FilePart(name="test.txt", data=b"Hello")
+        first = part.to_a2a()["file"]["bytes"]
+        assert part.to_a2a()["file"]["bytes"] is first
 
-        assert part.name == "test.txt"
-        assert part.data == data
+        part.data = b"Bye"
+        assert part.to_a2a()["file"]["bytes"] == _BYE_B64
 
-    def test_from_a2a_uri(self):
-        a2a_data = {
-            "type": "file",
-            "file": {
-                "name": "remote.txt",
-                "uri": "https://example.com/file.txt",
-            }
-        }
-        part = FilePart.from_a2a(a2a_data)
+    def test_to_a2a_bytes_follows_bytearray_mutation(self):
+        buffer = bytearray(b"Hello")
+        part = FilePart(name="test.txt", data=buffer)
+        assert part.to_a2a()["file"]["bytes"] == _HELLO_B64
 
-        assert part.name == "remote.txt"
-        assert part.uri == "https://example.com/file.txt"
+        buffer[:] = b"Bye"
+        assert part.to_a2a()["file"]["bytes"] == _BYE_B64
 
     @pytest.mark.asyncio
     async def test_read_bytes(self):
@@ -102,17 +129,6 @@ class TestDataPart:
         part = DataPart(data={"key": "value", "count": 42})
         assert part.data == {"key": "value", "count": 42}
 
-    def test_to_a2a(self):
-        part = DataPart(data={"key": "value"})
-        result = part.to_a2a()
-
-        assert result["type"] == "data"
-        assert result["data"] == {"key": "value"}
-
-    def test_from_a2a(self):
-        part = DataPart.from_a2a({"type": "data", "data": {"key": "value"}})
-        assert part.data == {"key": "value"}
-
 
 class TestArtifact:
     def test_creation(self):
@@ -151,6 +167,13 @@ class TestArtifact:
 
         assert len(artifact.parts) == 2
 
+    def test_add_parts(self):
+        parts = [TextPart(text="a"), DataPart(data={"b": 1})]
+        artifact = Artifact(name="bulk").add_text("first").add_parts(parts)
+
+        assert artifact.parts[1:] == parts
+        assert len(artifact.parts) == 3
+
     def test_to_a2a(self):
         artifact = Artifact(name="report", description="Test")
         artifact.add_text("Hello")
@@ -171,7 +194,7 @@ class TestParsePart:
     def test_parse_file(self):
         part = parse_part({
             "type": "file",
-            "file": {"name": "test.txt", "bytes": base64.b64encode(b"data").decode()}
+            "file": {"name": "test.txt", "bytes": _DATA_B64}
         })
         assert isinstance(part, FilePart)
 
@@ -245,7 +268,7 @@ class TestFilePartEdgeCases:
         """Test to_a2a with no data (defaults to empty bytes)."""
         part = FilePart(name="empty.txt", mime_type="text/plain")
         result = part.to_a2a()
-        assert result["file"]["bytes"] == base64.b64encode(b"").decode()
+        assert result["file"]["bytes"] == _EMPTY_B64
 
     def test_is_bytes_and_is_uri_both_none(self):
         """Test that both is_bytes and is_uri return False when no data."""
@@ -12,14 +12,9 @@ class User(BaseModel):
     age: int
 
 
-class CreateUserRequest(BaseModel):
-    user: User
-    notify: bool = False
-
-
-@pytest.fixture
+@pytest.fixture(scope="module")
 def pydantic_agent():
-    """Create an agent with Pydantic model parameters."""
+    """Create an agent with Pydantic model parameters, shared across the module."""
     agent = Agent(name="PydanticAgent", description="Uses Pydantic")
 
     @agent.skill("create_user")
@@ -38,13 +33,21 @@ def pydantic_agent():
     async def list_users(users: List[User]) -> int:
         return len(users)
 
+    @agent.skill("oldest_user")
+    async def oldest_user(users: List[User]) -> str:
+        return max(users, key=lambda u: u.age).name
+
     return agent
 
 
-def test_pydantic_model_input(pydantic_agent):
-    """Test that Pydantic models are auto-converted from dicts."""
-    client = AgentTestClient(pydantic_agent)
+@pytest.fixture(scope="module")
+def client(pydantic_agent):
+    """One test client for pydantic_agent, so its app is built only once."""
+    return AgentTestClient(pydantic_agent)
+
 
+def test_pydantic_model_input(client):
+    """Test that Pydantic models are auto-converted from dicts."""
     result = client.call("create_user", user={"name": "Alice", "age": 30})
 
     assert result.data["created"] is True
@@ -52,19 +55,15 @@ def test_pydantic_model_input(pydantic_agent):
     assert result.data["age"] == 30
 
 
-def test_pydantic_model_string_output(pydantic_agent):
+def test_pydantic_model_string_output(client):
     """Test skill returning string from Pydantic input."""
-    client = AgentTestClient(pydantic_agent)
-
     result = client.call("get_user_info", user={"name": "Bob", "age": 25})
 
     assert result == "Bob is 25 years old"
 
 
-def test_pydantic_list_of_models(pydantic_agent):
+def test_pydantic_list_of_models(client):
     """Test list of Pydantic models."""
-    client = AgentTestClient(pydantic_agent)
-
     users = [
         {"name": "Alice", "age": 30},
         {"name": "Bob", "age": 25},
@@ -75,6 +74,13 @@ def test_pydantic_list_of_models(pydantic_agent):
     assert result == 3
 
 
+def test_pydantic_list_items_are_models(client):
+    """List[Model] parameters arrive as validated model instances."""
+    users = [{"name": "Alice", "age": 30}, {"name": "Charlie", "age": 35}]
+
+    assert client.call("oldest_user", users=users) == "Charlie"
+
+
 def test_schema_generation_from_pydantic():
     """Test that schemas are generated from Pydantic models."""
     agent = Agent(name="Test", description="Test")
@@ -164,14 +170,16 @@ def test_pydantic_model_already_instance():
     assert result == "Carol (28)"
 
 
-def test_multiple_pydantic_params():
-    """Test skill with multiple Pydantic model parameters."""
-    class Source(BaseModel):
-        name: str
+class Source(BaseModel):
+    name: str
 
-    class Target(BaseModel):
-        name: str
 
+class Target(BaseModel):
+    name: str
+
+
+def test_multiple_pydantic_params():
+    """Test skill with multiple Pydantic model parameters."""
     agent = Agent(name="Test", description="Test")
 
     @agent.skill("transfer")
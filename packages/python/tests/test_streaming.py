@@ -2,155 +2,116 @@
 Tests for the streaming module.
 """
 import pytest
-import asyncio
-from unittest.mock import AsyncMock, MagicMock
 
 from a2a_lite.streaming import is_generator_function, collect_generator, stream_generator
 
 
-class TestIsGeneratorFunction:
-    def test_async_generator(self):
-        async def gen():
-            yield 1
+async def _async_range(n):
+    for i in range(n):
+        yield i
 
-        assert is_generator_function(gen) is True
 
-    def test_sync_generator(self):
-        def gen():
-            yield 1
+def _sync_doubles(n):
+    for i in range(n):
+        yield i * 2
 
-        assert is_generator_function(gen) is True
 
-    def test_regular_async_function(self):
-        async def func():
-            return 1
+async def _async_empty():
+    return
+    yield  # noqa: unreachable
 
-        assert is_generator_function(func) is False
 
-    def test_regular_sync_function(self):
-        def func():
-            return 1
+def _sync_empty():
+    return
+    yield  # noqa: unreachable
 
-        assert is_generator_function(func) is False
 
-    def test_lambda(self):
-        assert is_generator_function(lambda: 1) is False
+async def _async_single():
+    yield "only one"
 
 
-class TestCollectGenerator:
-    @pytest.mark.asyncio
-    async def test_async_generator(self):
-        async def gen():
-            for i in range(5):
-                yield i
+async def _async_mixed():
+    yield "text"
+    yield 42
+    yield {"key": "value"}
 
-        result = await collect_generator(gen())
-        assert result == [0, 1, 2, 3, 4]
 
-    @pytest.mark.asyncio
-    async def test_sync_generator(self):
-        def gen():
-            for i in range(3):
-                yield i * 2
+async def _async_func():
+    return 1
 
-        result = await collect_generator(gen())
-        assert result == [0, 2, 4]
 
-    @pytest.mark.asyncio
-    async def test_empty_async_generator(self):
-        async def gen():
-            return
-            yield  # noqa: unreachable
-
-        result = await collect_generator(gen())
-        assert result == []
+def _sync_func():
+    return 1
 
-    @pytest.mark.asyncio
-    async def test_empty_sync_generator(self):
-        def gen():
-            return
-            yield  # noqa: unreachable
 
-        result = await collect_generator(gen())
-        assert result == []
-
-    @pytest.mark.asyncio
-    async def test_single_item_generator(self):
-        async def gen():
-            yield "only one"
+class TestIsGeneratorFunction:
+    @pytest.mark.parametrize(
+        "func, expected",
+        [
+            (_async_range, True),
+            (_sync_doubles, True),
+            (_async_func, False),
+            (_sync_func, False),
+            (lambda: 1, False),
+        ],
+        ids=["async_generator", "sync_generator", "async_function", "sync_function", "lambda"],
+    )
+    def test_detection(self, func, expected):
+        assert is_generator_function(func) is expected
 
-        result = await collect_generator(gen())
-        assert result == ["only one"]
 
+class TestCollectGenerator:
     @pytest.mark.asyncio
-    async def test_mixed_types_generator(self):
-        async def gen():
-            yield "text"
-            yield 42
-            yield {"key": "value"}
-
-        result = await collect_generator(gen())
-        assert result == ["text", 42, {"key": "value"}]
+    @pytest.mark.parametrize(
+        "make_gen, expected",
+        [
+            (lambda: _async_range(5), [0, 1, 2, 3, 4]),
+            (lambda: _sync_doubles(3), [0, 2, 4]),
+            (_async_empty, []),
+            (_sync_empty, []),
+            (_async_single, ["only one"]),
+            (_async_mixed, ["text", 42, {"key": "value"}]),
+        ],
+        ids=["async", "sync", "empty_async", "empty_sync", "single_item", "mixed_types"],
+    )
+    async def test_collect(self, make_gen, expected):
+        assert await collect_generator(make_gen()) == expected
 
 
 class TestStreamGenerator:
     @pytest.mark.asyncio
-    async def test_async_generator_streaming(self):
-        events = []
-
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
-
+    async def test_async_generator_streaming(self, event_queue):
         async def gen():
             yield "hello"
             yield "world"
 
-        await stream_generator(gen(), MockEventQueue())
-        assert len(events) == 2
+        await stream_generator(gen(), event_queue)
+        assert len(event_queue.events) == 2
 
     @pytest.mark.asyncio
-    async def test_sync_generator_streaming(self):
-        events = []
-
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
-
+    async def test_sync_generator_streaming(self, event_queue):
         def gen():
             yield "one"
             yield "two"
             yield "three"
 
-        await stream_generator(gen(), MockEventQueue())
-        assert len(events) == 3
+        await stream_generator(gen(), event_queue)
+        assert len(event_queue.events) == 3
 
     @pytest.mark.asyncio
-    async def test_non_string_items_converted(self):
-        events = []
-
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
-
+    async def test_non_string_items_converted(self, event_queue):
         async def gen():
             yield 42
             yield 3.14
 
-        await stream_generator(gen(), MockEventQueue())
-        assert len(events) == 2
+        await stream_generator(gen(), event_queue)
+        assert len(event_queue.events) == 2
 
     @pytest.mark.asyncio
-    async def test_empty_generator_no_events(self):
-        events = []
-
-        class MockEventQueue:
-            async def enqueue_event(self, event):
-                events.append(event)
-
+    async def test_empty_generator_no_events(self, event_queue):
         async def gen():
             return
             yield  # noqa: unreachable
 
-        await stream_generator(gen(), MockEventQueue())
-        assert len(events) == 0
+        await stream_generator(gen(), event_queue)
+        assert len(event_queue.events) == 0
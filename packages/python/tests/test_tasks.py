@@ -123,6 +123,19 @@ class TestTaskStore:
         completed = await store.list(state=TaskState.COMPLETED)
         assert len(completed) == 1
 
+    @pytest.mark.asyncio
+    async def test_list_by_skill_follows_update_and_delete(self):
+        store = TaskStore()
+        moved = await store.create("skill1", {})
+        deleted = await store.create("skill1", {})
+
+        moved.skill = "skill2"
+        await store.update(moved)
+        await store.delete(deleted.id)
+
+        assert await store.list(skill="skill1") == []
+        assert await store.list(skill="skill2") == [moved]
+
     @pytest.mark.asyncio
     async def test_delete(self):
         store = TaskStore()
@@ -200,6 +213,19 @@ class TestTaskContext:
         await ctx.update(TaskState.COMPLETED, "Done!")
         assert task.status.state == TaskState.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_update_with_unknown_state_raises(self):
+        task = Task(
+            id="task-123",
+            skill="process",
+            params={},
+            status=TaskStatus(state=TaskState.SUBMITTED),
+        )
+        ctx = TaskContext(task)
+        with pytest.raises(ValueError):
+            await ctx.update("bogus")
+        assert task.status.state == TaskState.SUBMITTED
+
     @pytest.mark.asyncio
     async def test_multiple_status_changes_tracked_in_history(self):
         """Test that multiple updates create history entries."""
@@ -219,6 +245,37 @@ class TestTaskContext:
         assert task.status.state == TaskState.COMPLETED
         assert len(task.history) == 4  # SUBMITTED + 3 WORKING
 
+    @pytest.mark.asyncio
+    async def test_history_keeps_most_recent_statuses(self):
+        """Test that max_history bounds history and drops the oldest entries."""
+        task = Task(
+            id="task-123",
+            skill="process",
+            params={},
+            status=TaskStatus(state=TaskState.SUBMITTED),
+            max_history=3,
+        )
+        ctx = TaskContext(task)
+
+        for i in range(5):
+            await ctx.update("working", f"Step {i}")
+
+        assert [s.message for s in task.history] == ["Step 1", "Step 2", "Step 3"]
+        assert task.status.message == "Step 4"
+        # The initial SUBMITTED status and "Step 0" were the oldest and got dropped
+        assert all(s.state == TaskState.WORKING for s in task.history)
+
+    @pytest.mark.asyncio
+    async def test_store_applies_max_history(self):
+        bounded = await TaskStore(max_history=2).create("skill", {})
+        unbounded = await TaskStore().create("skill", {})
+        for i in range(5):
+            bounded.update_status(TaskState.WORKING, f"Step {i}")
+            unbounded.update_status(TaskState.WORKING, f"Step {i}")
+
+        assert len(bounded.history) == 2
+        assert len(unbounded.history) == 5
+
     @pytest.mark.asyncio
     async def test_async_status_callback(self):
         """Test that async status callbacks are awaited."""
@@ -273,6 +330,31 @@ class TestTaskStoreEdgeCases:
         tasks = await store.list(limit=5)
         assert len(tasks) == 5
 
+    @pytest.mark.asyncio
+    async def test_list_returns_newest_first(self):
+        """Filtered, limited listings keep newest-first order."""
+        from datetime import datetime, timedelta, timezone
+
+        store = TaskStore()
+        specs = [
+            ("a", TaskState.COMPLETED),
+            ("b", TaskState.COMPLETED),
+            ("a", TaskState.COMPLETED),
+            ("a", TaskState.FAILED),
+            ("a", TaskState.COMPLETED),
+        ]
+        base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        created = []
+        for i, (skill, state) in enumerate(specs):
+            task = await store.create(skill, {})
+            task.created_at = base + timedelta(minutes=i)
+            task.update_status(state)
+            await store.update(task)
+            created.append(task)
+
+        tasks = await store.list(state=TaskState.COMPLETED, skill="a", limit=2)
+        assert [t.id for t in tasks] == [created[4].id, created[2].id]
+
     @pytest.mark.asyncio
     async def test_update(self):
         """Test updating a task in the store."""
@@ -326,6 +408,12 @@ class TestTaskStatusDefaults:
 
 
 class TestTaskDefaults:
+    def test_uses_slots(self):
+        status = TaskStatus(state=TaskState.SUBMITTED)
+        task = Task(id="test", skill="skill", params={}, status=status)
+        assert not hasattr(status, "__dict__")
+        assert not hasattr(task, "__dict__")
+
     def test_default_fields(self):
         """Test Task default field values."""
         task = Task(
@@ -84,6 +84,11 @@ class TestTestResult:
         result = TestResult(_data={"key": "value"}, _text='{"key": "value"}', raw_response={})
         assert result.json() == {"key": "value"}
 
+    def test_json_parses_text_for_scalars(self):
+        result = TestResult(_data=42.0, _text="42", raw_response={})
+        assert result.json() == 42
+        assert isinstance(result.json(), int)
+
     def test_json_invalid(self):
         result = TestResult(_data="not json", _text="not json", raw_response={})
         with pytest.raises(Exception):
@@ -1,9 +1,23 @@
 """
 Tests for utility functions.
 """
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional, Union
+from unittest.mock import patch
+
 import pytest
-from typing import List, Dict, Optional, Any
-from a2a_lite.utils import type_to_json_schema, extract_function_schemas
+from pydantic import BaseModel
+
+from a2a_lite import utils
+from a2a_lite.utils import (
+    _is_or_subclass,
+    _json_dumps,
+    _json_loads,
+    extract_function_schemas,
+    type_to_json_schema,
+)
 
 
 class TestTypeToJsonSchema:
@@ -176,19 +190,34 @@ class TestExtractFunctionSchemas:
         assert input_schema["properties"] == {}
         assert input_schema["required"] == []
 
+    def test_preresolved_hints_skip_get_type_hints(self):
+        """Test that passing resolved hints avoids re-running get_type_hints."""
+        def func(x: int) -> str:
+            return str(x)
+
+        with patch("typing.get_type_hints", side_effect=AssertionError("resolved")):
+            input_schema, output_schema = extract_function_schemas(
+                func, {"x": int, "return": str}
+            )
+        assert input_schema["properties"] == {"x": {"type": "integer"}}
+        assert output_schema == {"type": "string"}
+
+    def test_basic_schemas_are_not_shared(self):
+        """Test that callers can mutate returned basic-type schemas safely."""
+        schema = type_to_json_schema(str)
+        schema["description"] = "changed"
+        assert type_to_json_schema(str) == {"type": "string"}
+
 
 class TestTypeToJsonSchemaAdvanced:
     def test_union_type(self):
         """Test Union[int, str] type."""
-        from typing import Union
         schema = type_to_json_schema(Union[int, str])
         assert "oneOf" in schema
         assert len(schema["oneOf"]) == 2
 
     def test_pydantic_model(self):
         """Test Pydantic BaseModel."""
-        from pydantic import BaseModel
-
         class TestModel(BaseModel):
             name: str
             age: int
@@ -198,11 +227,31 @@ class TestTypeToJsonSchemaAdvanced:
         assert "name" in schema["properties"]
         assert "age" in schema["properties"]
 
+    def test_pydantic_schema_generated_once(self):
+        """Pydantic schemas are cached per model but returned as copies."""
+        class TestModel(BaseModel):
+            name: str
+
+        with patch.object(
+            TestModel, "model_json_schema", wraps=TestModel.model_json_schema
+        ) as generate:
+            first = type_to_json_schema(TestModel)
+            first["properties"]["name"]["type"] = "mutated"
+            second = type_to_json_schema(TestModel)
+
+        assert generate.call_count == 1
+        assert second["properties"]["name"]["type"] == "string"
+
     def test_optional_int(self):
         """Test Optional[int]."""
         schema = type_to_json_schema(Optional[int])
         assert schema == {"type": "integer"}
 
+    def test_pep604_union(self):
+        """Test X | None and X | Y match their typing.Union forms."""
+        assert type_to_json_schema(int | None) == {"type": "integer"}
+        assert type_to_json_schema(int | str) == type_to_json_schema(Union[int, str])
+
     def test_dict_str_str(self):
         """Test Dict[str, str]."""
         schema = type_to_json_schema(Dict[str, str])
@@ -225,12 +274,9 @@ class TestTypeToJsonSchemaAdvanced:
 
 class TestIsOrSubclass:
     def test_exact_match(self):
-        from a2a_lite.utils import _is_or_subclass
         assert _is_or_subclass(int, int) is True
 
     def test_subclass(self):
-        from a2a_lite.utils import _is_or_subclass
-
         class Parent:
             pass
 
@@ -240,28 +286,22 @@ class TestIsOrSubclass:
         assert _is_or_subclass(Child, Parent) is True
 
     def test_no_match(self):
-        from a2a_lite.utils import _is_or_subclass
         assert _is_or_subclass(str, int) is False
 
     def test_non_type_hint(self):
-        from a2a_lite.utils import _is_or_subclass
         # Generic types may raise TypeError in issubclass
         assert _is_or_subclass(List[str], int) is False
 
     def test_optional_str(self):
         """Test that Optional[str] is detected as subclass of str."""
-        from a2a_lite.utils import _is_or_subclass
         assert _is_or_subclass(Optional[str], str) is True
 
     def test_optional_int(self):
         """Test that Optional[int] is detected as subclass of int."""
-        from a2a_lite.utils import _is_or_subclass
         assert _is_or_subclass(Optional[int], int) is True
 
     def test_optional_custom_class(self):
         """Test that Optional[CustomClass] is detected as subclass of CustomClass."""
-        from a2a_lite.utils import _is_or_subclass
-
         class MyClass:
             pass
 
@@ -269,20 +309,84 @@ class TestIsOrSubclass:
 
     def test_optional_no_match(self):
         """Test that Optional[str] is NOT detected as subclass of int."""
-        from a2a_lite.utils import _is_or_subclass
         assert _is_or_subclass(Optional[str], int) is False
 
     def test_union_with_none(self):
         """Test that Union[str, None] works like Optional[str]."""
-        from a2a_lite.utils import _is_or_subclass
-        from typing import Union
         assert _is_or_subclass(Union[str, None], str) is True
         assert _is_or_subclass(Union[int, None], int) is True
 
+    def test_pep604_optional(self):
+        """Test that str | None works like Optional[str]."""
+        assert _is_or_subclass(str | None, str) is True
+
     def test_union_multiple_types(self):
         """Test that Union with multiple non-None types returns False."""
-        from a2a_lite.utils import _is_or_subclass
-        from typing import Union
         # Union[str, int, None] is Optional[Union[str, int]]
         # Should NOT match str exactly
         assert _is_or_subclass(Union[str, int, None], str) is False
+
+
+class TestJsonLoads:
+    """Tests for the _json_loads helper."""
+
+    def test_parses_str_and_bytes(self):
+        assert _json_loads('{"a": 1}') == {"a": 1}
+        assert _json_loads(b'[1, 2]') == [1, 2]
+
+    def test_invalid_json_raises_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            _json_loads("not json")
+
+    @pytest.mark.parametrize(
+        "text", ['{"n": 123456789012345678901234567890}', "[-9223372036854775809]"]
+    )
+    def test_wide_integers_keep_precision(self, text):
+        assert _json_loads(text) == json.loads(text)
+        assert _json_loads(text.encode()) == json.loads(text)
+
+    def test_non_finite_numbers_match_stdlib(self):
+        value = _json_loads('[NaN, Infinity, -Infinity]')
+        assert value[0] != value[0]
+        assert value[1:] == [float("inf"), float("-inf")]
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(utils, "orjson", None)
+        assert utils._json_loads('{"a": 1}') == {"a": 1}
+        with pytest.raises(json.JSONDecodeError):
+            utils._json_loads("not json")
+
+
+class TestJsonDumps:
+    """Tests for the _json_dumps helper."""
+
+    def test_matches_stdlib_round_trip(self):
+        value = {"a": 1, 2: [True, None], "when": datetime(2024, 1, 2, 3, 4, 5)}
+        assert json.loads(_json_dumps(value)) == json.loads(json.dumps(value, default=str))
+
+    def test_indent(self):
+        assert _json_dumps({"a": 1}, indent=True) == '{\n  "a": 1\n}'
+
+    def test_falls_back_on_unsupported_values(self):
+        assert _json_dumps({"big": 2**70}) == '{"big": 1180591620717411303424}'
+
+    def test_stdlib_fallback(self, monkeypatch):
+        monkeypatch.setattr(utils, "orjson", None)
+        assert utils._json_dumps({"a": object}) == '{"a": "<class \'object\'>"}'
+
+    def test_orjson_divergence_from_stdlib(self, monkeypatch):
+        """Non-ASCII text, plain Enums and non-finite floats are the documented differences."""
+        pytest.importorskip("orjson")
+
+        class Color(Enum):
+            RED = 1
+
+        value = {"c": Color.RED, "x": float("nan"), "s": "café"}
+        assert _json_dumps(value) == '{"c":1,"x":null,"s":"café"}'
+
+        monkeypatch.setattr(utils, "orjson", None)
+        assert utils._json_dumps(value) == '{"c": "Color.RED", "x": NaN, "s": "caf\\u00e9"}'
+
+    def test_default_none_rejects_unsupported_values(self):
+        with pytest.raises(TypeError):
+            _json_dumps({"when": datetime(2024, 1, 1)}, default=None)